@@ -12,15 +12,22 @@ Features:
 from __future__ import annotations
 
 import argparse
+import codecs
+import io
 import json
 import logging
+import mmap
+import os
 import re
 import shutil
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from codingutils.common_utils import (
     FilterConfig,
@@ -40,10 +47,42 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
     detect = None
     LangDetectException = Exception
+# langdetect's own detect(); only while `detect` is still this is the private profile factory used.
+_langdetect_detect = detect
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# process_files() only starts worker processes for more uncached files than this; spawning
+# the pool costs more than reading a few dozen small files in-process.
+_PARALLEL_MIN_FILES = 64
+
+# Files of at least this many bytes are memory-mapped rather than read into a bytes object.
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Write buffer for the text export report.
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Code keywords and punctuation runs are both replaced by a space before language detection.
+_LANGDETECT_NOISE_RE = re.compile(
+    r"\b(?:def|class|function|var|let|const|import|from|return|if|else)\b|[^\w\s]+",
+    re.IGNORECASE,
+)
+# Any letter (a word character that is not a digit or underscore).
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Marker prefixes/suffixes stripped from the cleaned comment text.
+_LINE_PREFIX_RE = re.compile(r"^\s*(#|//|--)\s?")
+_BLOCK_PREFIX_RE = re.compile(r"^\s*(/\*|<!--|\"\"\"|''')\s?")
+_BLOCK_SUFFIX_RE = re.compile(r"\s*(\*/|-->|\"\"\"|''')\s*$")
+
 
 
 
@@ -103,7 +142,11 @@ class CommentMatch:
     text: str
 
 
-@dataclass(slots=True)
+# (removed_count, matches) on success, or (None, error message) when the file failed.
+_FileOutcome = Tuple[Optional[Tuple[int, List[CommentMatch]]], Optional[str]]
+
+
+@dataclass(frozen=True, slots=True)
 class CommentStyle:
     line_markers: Tuple[str, ...] = ()
     block_markers: Tuple[Tuple[str, str], ...] = ()
@@ -135,6 +178,131 @@ class CommentStyle:
 
 
 
+# Profiles langdetect loads when a language filter is used (the filter language is always added).
+# Loading all ~55 bundled profiles costs tens of MB and slows every detect() call.
+_LANGDETECT_PROFILES = frozenset({
+    "en", "es", "ar", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh-cn", "zh-tw", "hi", "bn", "id",
+})
+
+
+# Module-private (requested profile set, DetectorFactory); langdetect's own global is never touched.
+_langdetect_factory: Optional[Tuple[FrozenSet[str], Any]] = None
+
+
+def _langdetect_factory_for(language: str) -> Optional[Any]:
+    """DetectorFactory holding the profile subset plus `language`, or None if it cannot be built."""
+    global _langdetect_factory
+    cached = _langdetect_factory
+    if cached is not None and language in cached[0]:
+        return cached[1]
+    try:
+        from langdetect import detector_factory
+
+        wanted = _LANGDETECT_PROFILES | {language}
+        profiles: List[str] = []
+        for name in sorted(os.listdir(detector_factory.PROFILES_DIRECTORY)):
+            if name in wanted:
+                with open(os.path.join(detector_factory.PROFILES_DIRECTORY, name), encoding="utf-8") as f:
+                    profiles.append(f.read())
+
+        factory = detector_factory.DetectorFactory()
+        factory.load_json_profile(profiles)
+    except Exception as e:
+        # Callers fall back to langdetect.detect, which loads every profile itself.
+        logger.debug("Could not load langdetect profiles: %s", e)
+        return None
+    _langdetect_factory = (wanted, factory)
+    return factory
+
+
+def _detect_with_factory(factory: Any, text: str) -> str:
+    detector = factory.create()
+    detector.append(text)
+    return detector.detect()
+
+
+# Encodings (codecs names) in which ASCII markers are encoded as the same bytes.
+_ASCII_COMPATIBLE_ENCODINGS = frozenset({"ascii", "utf-8", "iso8859-1", "cp1252"})
+
+
+@lru_cache(maxsize=256)
+def _marker_bytes(style: CommentStyle, encoding: str) -> Optional[Tuple[bytes, ...]]:
+    """Start markers as raw bytes for a substring prefilter, or None if that would be unsafe."""
+    markers = style.line_markers + tuple(s for s, _e in style.block_markers)
+    if not markers or not all(m.isascii() for m in markers):
+        return None
+    try:
+        if codecs.lookup(encoding).name not in _ASCII_COMPATIBLE_ENCODINGS:
+            return None
+    except LookupError:
+        return None
+    encoded = tuple(m.encode("ascii") for m in markers if m)
+    return encoded or None
+
+
+@lru_cache(maxsize=256)
+def _token_pattern(quotes: Tuple[str, ...], tokens: Tuple[str, ...]) -> re.Pattern[str]:
+    """
+    One regex equivalent to the old per-character scan: a quote opens a string that
+    runs to the same quote or end of line (backslash escapes the next char), and
+    otherwise the first listed token found at a position wins.
+    """
+    strings = [rf"{re.escape(q)}(?:\\.?|[^{re.escape(q)}\\])*{re.escape(q)}?" for q in quotes]
+    toks = "|".join(re.escape(t) for t in tokens if t)
+    alternatives = strings + ([f"(?P<tok>{toks})"] if toks else [])
+    return re.compile("|".join(alternatives), re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def _marker_pattern(tokens: Tuple[str, ...]) -> re.Pattern[str]:
+    """Plain alternation of the markers, used to skip lines that cannot hold a comment."""
+    return re.compile("|".join(re.escape(t) for t in tokens))
+
+
+def _find_token(pattern: re.Pattern[str], line: str, start: int) -> Tuple[int, Optional[str]]:
+    # String literals are matched first, so tokens inside them are consumed unseen.
+    for m in pattern.finditer(line, start):
+        if m.lastgroup == "tok":
+            return m.start(), m.group()
+    return -1, None
+
+
+def _skip_string(line: str, quote: str, start: int) -> int:
+    """Index just past the string opened at ``start``: its closing quote, or end of line."""
+    i = start + 1
+    n = len(line)
+    while i < n:
+        q = line.find(quote, i)
+        b = line.find("\\", i)
+        if q == -1:
+            return n
+        if b == -1 or q < b:
+            return q + 1
+        i = b + 2
+    return n
+
+
+def _find_char_token(marker: str, line: str, start: int) -> Tuple[int, Optional[str]]:
+    """
+    Same result as ``_find_token`` for a single one-character marker (e.g. ``#``),
+    using str.find for the marker and only skipping strings that open before it.
+    """
+    quotes = _StringScanner.QUOTES
+    i = start
+    while True:
+        pos = line.find(marker, i)
+        if pos == -1:
+            return -1, None
+        opened = -1
+        for q in quotes:
+            qpos = line.find(q, i, pos)
+            if qpos != -1 and (opened == -1 or qpos < opened):
+                opened = qpos
+        if opened == -1:
+            return pos, marker
+        i = _skip_string(line, line[opened], opened)
+
+
 class _StringScanner:
     """Find tokens outside simple single-line strings."""
     QUOTES = ('"', "'", "`")
@@ -149,35 +317,7 @@ class _StringScanner:
         if not tokens:
             return -1, None
 
-        in_str = False
-        quote: Optional[str] = None
-        i = start
-
-        while i < len(line):
-            ch = line[i]
-
-            if in_str and ch == "\\":
-                i += 2
-                continue
-
-            if ch in cls.QUOTES:
-                if not in_str:
-                    in_str = True
-                    quote = ch
-                elif quote == ch:
-                    in_str = False
-                    quote = None
-                i += 1
-                continue
-
-            if not in_str:
-                for tok in tokens:
-                    if tok and line.startswith(tok, i):
-                        return i, tok
-
-            i += 1
-
-        return -1, None
+        return _find_token(_token_pattern(cls.QUOTES, tuple(tokens)), line, start)
 
 
 
@@ -202,6 +342,26 @@ class CommentScanner:
         self.style = style
         self.exclude_comment_pattern = exclude_comment_pattern
 
+        # Marker lookups are fixed per style; derive them once instead of per line.
+        self._tokens: Tuple[str, ...] = style.line_markers + tuple(s for s, _e in style.block_markers)
+        # Compiled patterns come from process-wide lru_caches (thread-safe), shared by all scanners.
+        self._marker_re = _marker_pattern(self._tokens)
+        self._token_re = _token_pattern(_StringScanner.QUOTES, self._tokens)
+        self._find_token: Callable[[str, int], Tuple[int, Optional[str]]]
+        if (
+            len(style.line_markers) == 1
+            and not style.block_markers
+            and len(style.line_markers[0]) == 1
+            and style.line_markers[0] not in _StringScanner.QUOTES
+        ):
+            # Python/shell-like styles: a plain str.find beats the regex engine.
+            self._find_token = partial(_find_char_token, style.line_markers[0])
+        else:
+            self._find_token = partial(_find_token, self._token_re)
+        self._line_markers = frozenset(style.line_markers)
+        self._block_ends: Dict[str, str] = {}
+        for s, e in style.block_markers:
+            self._block_ends.setdefault(s, e)
 
         self._in_block = False
         self._block_end_tok = ""
@@ -218,24 +378,42 @@ class CommentScanner:
         remove: bool,
         should_remove: "callable[[CommentMatch], bool]",
     ) -> Tuple[List[str], List[CommentMatch], int]:
+        # Scanners are reused across files; never inherit state from a scan that raised.
+        self._reset_block_state()
+
+        # Without removal the output is the input verbatim, so only matches are collected
+        # and the input list itself is returned instead of a line-by-line copy.
+        if not remove and not isinstance(lines, list):
+            lines = list(lines)
+
         out_lines: List[str] = []
         matches: List[CommentMatch] = []
         removed_count = 0
+        has_marker = self._marker_re.search
+        keep_line = out_lines.append
 
         for line_no, raw_line in enumerate(lines, 1):
             if self._in_block:
                 flushed, new_matches, removed_delta = self._process_line_in_block(
                     line_no, raw_line, remove=remove, should_remove=should_remove
                 )
-                out_lines.extend(flushed)
+                if remove:
+                    out_lines.extend(flushed)
                 matches.extend(new_matches)
                 removed_count += removed_delta
                 continue
 
+            # Most lines contain no marker at all; keep them as-is without tokenizing.
+            if has_marker(raw_line) is None:
+                if remove:
+                    keep_line(raw_line)
+                continue
+
             flushed, new_matches, removed_delta = self._process_line_no_block(
                 line_no, raw_line, remove=remove, should_remove=should_remove
             )
-            out_lines.extend(flushed)
+            if remove:
+                out_lines.extend(flushed)
             matches.extend(new_matches)
             removed_count += removed_delta
 
@@ -246,10 +424,10 @@ class CommentScanner:
 
                 out_lines.append(self._block_prefix_before_start.rstrip() + "\n")
                 out_lines.extend(["\n"] * max(0, len(self._block_original_lines) - 1))
-            else:
-                out_lines.extend(self._block_original_lines)
             self._reset_block_state()
 
+        if not remove:
+            return lines, matches, removed_count
         return out_lines, matches, removed_count
 
     def _process_line_no_block(
@@ -263,9 +441,7 @@ class CommentScanner:
         nl = "\n" if raw_line.endswith("\n") else ""
         line = raw_line[:-1] if nl else raw_line
 
-        tokens: List[str] = []
-        tokens.extend(self.style.line_markers)
-        tokens.extend([s for s, _e in self.style.block_markers])
+        find_token = self._find_token
 
         out = line
         i = 0
@@ -273,12 +449,12 @@ class CommentScanner:
         removed = 0
 
         while i < len(out):
-            pos, tok = _StringScanner.find_next_token_outside_strings(out, i, tokens)
+            pos, tok = find_token(out, i)
             if pos == -1 or tok is None:
                 break
 
 
-            if tok in self.style.line_markers:
+            if tok in self._line_markers:
                 raw_comment = out[pos:]
                 if self._is_excluded(raw_comment):
 
@@ -442,10 +618,7 @@ class CommentScanner:
         self._block_raw_parts = []
 
     def _end_for_start(self, start_tok: str) -> str:
-        for s, e in self.style.block_markers:
-            if s == start_tok:
-                return e
-        return ""
+        return self._block_ends.get(start_tok, "")
 
     def _is_excluded(self, raw_comment: str) -> bool:
         if not self.exclude_comment_pattern:
@@ -456,12 +629,10 @@ class CommentScanner:
     def _clean_comment_text(raw: str, *, kind: str) -> str:
         s = raw.strip()
         if kind == "line":
-            s = re.sub(r"^\s*(#|//|--)\s?", "", s)
-            return s.strip()
+            return _LINE_PREFIX_RE.sub("", s, count=1).strip()
 
-        s = re.sub(r"^\s*(/\*|<!--|\"\"\"|''')\s?", "", s)
-        s = re.sub(r"\s*(\*/|-->|\"\"\"|''')\s*$", "", s)
-        return s.strip()
+        s = _BLOCK_PREFIX_RE.sub("", s, count=1)
+        return _BLOCK_SUFFIX_RE.sub("", s, count=1).strip()
 
 
 
@@ -474,12 +645,26 @@ class CommentProcessor:
         self.file_walker = self._create_walker(config)
 
 
-        self._cache: Optional[Dict[str, Tuple[float, Tuple[int, List[CommentMatch]]]]] = (
+        # path -> ((st_mtime_ns, st_size), result); integer stamps compare exactly.
+        self._cache: Optional[Dict[str, Tuple[Tuple[int, int], Tuple[int, List[CommentMatch]]]]] = (
             {} if config.use_cache else None
         )
 
+        # Styles per suffix and one scanner per style, reused for every file of a run.
+        self._styles: Dict[str, CommentStyle] = {}
+        self._scanners: Dict[CommentStyle, CommentScanner] = {}
+
+        # Identical comments (license headers, stock notes) repeat a lot; detect each text once.
+        # Keyed by the detector too, so swapping `detect` never serves stale answers.
+        self._detect_cached = lru_cache(maxsize=4096)(_detect_language)
+        self._factory_detect: Optional[Callable[[str], str]] = None
+
         if self.config.language_filter and not LANGDETECT_AVAILABLE:
             logger.warning("Language filter requested but langdetect is not installed; filter will be ignored.")
+        elif self.config.language_filter:
+            factory = _langdetect_factory_for(self.config.language_filter)
+            if factory is not None:
+                self._factory_detect = partial(_detect_with_factory, factory)
 
         if self.config.backup_dir is not None:
             self.config.backup_dir = Path(self.config.backup_dir).resolve()
@@ -521,31 +706,41 @@ class CommentProcessor:
         total_comments = 0
         all_comments: List[Dict[str, Any]] = []
 
+        # One level check per run instead of one logger call per comment when INFO is off.
+        log_each_comment = logger.isEnabledFor(logging.INFO)
+        # License headers and stock notes repeat across files; keep one copy of each string.
+        shared: Dict[str, str] = {}
+        share = shared.setdefault
+
         with ProgressReporter(total=len(files), description="Extracting comments") as progress:
-            for p in files:
-                try:
-                    removed, matches = self.process_file(p)
-                    total_removed += removed
-                    total_comments += len(matches)
+            for p, (outcome, error) in zip(files, self._iter_file_results(files)):
+                if outcome is None:
+                    logger.error("Failed to process %s: %s", p, error)
+                    progress.update(1)
+                    continue
 
-                    rel = get_relative_path(p)
-                    for m in matches:
+                removed, matches = outcome
+                total_removed += removed
+                total_comments += len(matches)
+
+                rel = get_relative_path(p)
+                file_str = str(p)
+                for m in matches:
+                    if log_each_comment:
                         logger.info("%s:%d: %s", rel, m.start_line, m.text)
-                        all_comments.append(
-                            {
-                                "file": str(p),
-                                "relative_path": rel,
-                                "kind": m.kind,
-                                "start_line": m.start_line,
-                                "start_col": m.start_col,
-                                "end_line": m.end_line,
-                                "end_col": m.end_col,
-                                "text": m.text,
-                                "raw": m.raw,
-                            }
-                        )
-                except Exception as e:
-                    logger.error("Failed to process %s: %s", p, e)
+                    all_comments.append(
+                        {
+                            "file": file_str,
+                            "relative_path": rel,
+                            "kind": m.kind,
+                            "start_line": m.start_line,
+                            "start_col": m.start_col,
+                            "end_line": m.end_line,
+                            "end_col": m.end_col,
+                            "text": share(m.text, m.text),
+                            "raw": share(m.raw, m.raw),
+                        }
+                    )
 
                 progress.update(1)
 
@@ -561,44 +756,113 @@ class CommentProcessor:
             "comments": all_comments,
         }
 
+    def _iter_file_results(self, files: Sequence[Path]) -> Iterator[_FileOutcome]:
+        """
+        Yield one outcome per file, in input order.
+
+        Cache hits are answered in this process; large batches of misses are spread over
+        worker processes, whose results are written back into the cache. Only read-only
+        extraction is parallel: removal picks backup names by exists()-then-copy, and
+        same-named files from different roots can share a backup target.
+        """
+        if (
+            self.config.remove_comments
+            or len(files) <= _PARALLEL_MIN_FILES
+            or (os.cpu_count() or 1) <= 1
+        ):
+            for p in files:
+                yield self._process_file_safe(p)
+            return
+
+        hits: Dict[int, _FileOutcome] = {}
+        misses: List[Path] = []
+        for i, p in enumerate(files):
+            cached = self._cached_result(p)[2]
+            if cached is None:
+                misses.append(p)
+            else:
+                hits[i] = (cached, None)
+
+        if len(misses) > _PARALLEL_MIN_FILES:
+            pending: Iterator[_FileOutcome] = self._iter_pool_results(misses)
+        else:
+            pending = map(self._process_file_safe, misses)
+
+        for i in range(len(files)):
+            hit = hits.get(i)
+            yield hit if hit is not None else next(pending)
+
+    def _iter_pool_results(self, files: Sequence[Path]) -> Iterator[_FileOutcome]:
+        """Outcomes from worker processes; finishes in-process if the pool breaks."""
+        workers = min(os.cpu_count() or 1, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config, logger.getEffectiveLevel())) as ex:
+                for p, (outcome, error, entry) in zip(files, ex.map(_process_file_worker, files, chunksize=chunksize)):
+                    if entry is not None and self._cache is not None:
+                        self._cache[os.fspath(p)] = entry
+                    done += 1
+                    yield outcome, error
+        except BrokenProcessPool as e:
+            logger.error("Worker process failed (%s); processing %d remaining files in-process", e, len(files) - done)
+            for p in files[done:]:
+                yield self._process_file_safe(p)
+
+    def _process_file_safe(self, file_path: Path) -> _FileOutcome:
+        try:
+            return self.process_file(file_path), None
+        except Exception as e:
+            return None, str(e)
+
+    def _cached_result(
+        self, file_path: Path
+    ) -> Tuple[str, Tuple[int, int], Optional[Tuple[int, List[CommentMatch]]]]:
+        """(cache key, current stamp, cached result if still valid)."""
+        cache_key = os.fspath(file_path)
+        try:
+            st = os.stat(cache_key)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = (-1, -1)
+        if self._cache is not None:
+            entry = self._cache.get(cache_key)
+            if entry is not None and entry[0] == stamp:
+                return cache_key, stamp, entry[1]
+        return cache_key, stamp, None
+
     def process_file(self, file_path: Path) -> Tuple[int, List[CommentMatch]]:
+        # Only text files are cached, so a hit also skips the file-type sniff.
+        cache_key, stamp, cached = self._cached_result(file_path)
+        if cached is not None:
+            return cached
+
         if FileContentDetector.detect_file_type(file_path) != FileType.TEXT:
             logger.debug("Skipping non-text file: %s", file_path)
             return 0, []
 
-        cache_key = str(file_path)
-        try:
-            mtime = file_path.stat().st_mtime
-        except Exception:
-            mtime = -1.0
-
-        if self._cache is not None and cache_key in self._cache:
-            cached_mtime, cached_result = self._cache[cache_key]
-            if cached_mtime == mtime:
-                return cached_result
-
         encoding = FileContentDetector.detect_encoding(file_path)
-        try:
-            with open(file_path, "r", encoding=encoding, errors="strict") as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            logger.warning("Decoding failed with %s for %s, falling back to latin-1", encoding, file_path)
-            encoding = "latin-1"
-            with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                lines = f.readlines()
+        style = self._style_for(file_path)
 
-        style = (
-            CommentStyle.from_override(self.config.comment_symbols)
-            if self.config.comment_symbols
-            else CommentStyle.from_extension(file_path.suffix)
-        )
-        if not style.line_markers and not style.block_markers:
-            style = CommentStyle(line_markers=("#",), block_markers=())
+        decoded = self._read_marked_text(file_path, encoding, _marker_bytes(style, encoding))
+        if decoded is None:
+            # No marker bytes at all: nothing to find or remove.
+            result = (0, [])
+            if self._cache is not None:
+                self._cache[cache_key] = (stamp, result)
+            return result
+
+        text, encoding = decoded
+        # Same universal-newline splitting as reading the file in text mode.
+        lines = io.StringIO(text, newline=None).readlines()
 
         if self.config.remove_comments and file_path.suffix.lower() == ".py" and style.block_markers:
             logger.warning("Removing block comments in .py may remove docstrings: %s", file_path)
 
-        scanner = CommentScanner(style, exclude_comment_pattern=self.config.exclude_comment_pattern)
+        scanner = self._scanners.get(style)
+        if scanner is None:
+            scanner = CommentScanner(style, exclude_comment_pattern=self.config.exclude_comment_pattern)
+            self._scanners[style] = scanner
 
         def should_remove(m: CommentMatch) -> bool:
             if not self.config.remove_comments:
@@ -646,13 +910,47 @@ class CommentProcessor:
 
         result = (removed_count, matches)
         if self._cache is not None:
-            self._cache[cache_key] = (mtime, result)
+            self._cache[cache_key] = (stamp, result)
         return result
 
 
 
 
 
+    @staticmethod
+    def _read_marked_text(
+        file_path: Path,
+        encoding: str,
+        marker_bytes: Optional[Tuple[bytes, ...]],
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Return (text, encoding actually used), or None if no marker bytes occur in the file.
+
+        Large files are mapped instead of read, so the marker check and the decode
+        run over the page cache without an intermediate bytes copy.
+        """
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                return _decode_marked(f.read(), encoding, marker_bytes, file_path)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _decode_marked(data, encoding, marker_bytes, file_path)
+
+    def _style_for(self, file_path: Path) -> CommentStyle:
+        suffix = file_path.suffix
+        style = self._styles.get(suffix)
+        if style is not None:
+            return style
+
+        style = (
+            CommentStyle.from_override(self.config.comment_symbols)
+            if self.config.comment_symbols
+            else CommentStyle.from_extension(suffix)
+        )
+        if not style.line_markers and not style.block_markers:
+            style = CommentStyle(line_markers=("#",), block_markers=())
+        self._styles[suffix] = style
+        return style
+
     def _backup_base_dir(self) -> Path:
 
         if self.config.directories:
@@ -721,19 +1019,21 @@ class CommentProcessor:
         cleaned = self._normalize_for_langdetect(comment_text)
         if len(cleaned) < int(self.config.min_langdetect_len):
             return True
-
-        try:
-            lang = detect(cleaned)
-            return lang == self.config.language_filter
-        except LangDetectException:
+        # Digits/underscores only: langdetect finds no features and fails, which also
+        # means "remove"; skip the call.
+        if _LETTER_RE.search(cleaned) is None:
             return True
 
+        detector = detect
+        if self._factory_detect is not None and detector is _langdetect_detect:
+            # A replaced module-level `detect` (tests, embedders) takes precedence.
+            detector = self._factory_detect
+        lang = self._detect_cached(detector, cleaned)
+        return lang is None or lang == self.config.language_filter
+
     @staticmethod
     def _normalize_for_langdetect(text: str) -> str:
-        s = re.sub(r"\b(def|class|function|var|let|const|import|from|return|if|else)\b", " ", text, flags=re.I)
-        s = re.sub(r"[^\w\s]+", " ", s, flags=re.UNICODE)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return " ".join(_LANGDETECT_NOISE_RE.sub(" ", text).split())
 
 
 
@@ -751,20 +1051,30 @@ class CommentProcessor:
                     "total_comments": len(comments),
                     "comments": comments,
                 }
-                with open(export_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, ensure_ascii=False, indent=2)
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+                with open(export_path, "wb") as f:
+                    f.write(data)
                 logger.info("Comments exported to: %s", export_path)
                 return
 
             if suf == ".jsonl":
-                with open(export_path, "w", encoding="utf-8") as f:
-                    for c in comments:
-                        f.write(json.dumps(c, ensure_ascii=False) + "\n")
+                # Encode all records up front and hand the file a single buffer.
+                if ORJSON_AVAILABLE:
+                    dumps, option = orjson.dumps, orjson.OPT_APPEND_NEWLINE
+                    data = b"".join([dumps(c, option=option) for c in comments])
+                else:
+                    data = "".join([json.dumps(c, ensure_ascii=False) + "\n" for c in comments]).encode("utf-8")
+                with open(export_path, "wb") as f:
+                    f.write(data)
                 logger.info("Comments exported to: %s", export_path)
                 return
 
 
-            with open(export_path, "w", encoding="utf-8") as f:
+            # Many small writes per comment; a large buffer turns them into few syscalls.
+            with open(export_path, "w", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE) as f:
                 f.write("EXTRACTED COMMENTS REPORT\n")
                 f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"Total comments: {len(comments)}\n")
@@ -842,6 +1152,53 @@ class CommentProcessor:
 
 
 
+def _decode_marked(
+    data: Any,
+    encoding: str,
+    marker_bytes: Optional[Tuple[bytes, ...]],
+    file_path: Path,
+) -> Optional[Tuple[str, str]]:
+    """Decode `data` (bytes or mmap) unless the marker prefilter rules the file out."""
+    if marker_bytes is not None and all(data.find(m) == -1 for m in marker_bytes):
+        return None
+    try:
+        return str(data, encoding), encoding
+    except UnicodeDecodeError:
+        logger.warning("Decoding failed with %s for %s, falling back to latin-1", encoding, file_path)
+        return str(data, "latin-1", "replace"), "latin-1"
+
+
+def _detect_language(detector: Callable[[str], str], text: str) -> Optional[str]:
+    """Language code for `text`, or None when langdetect cannot decide."""
+    try:
+        return detector(text)
+    except LangDetectException:
+        return None
+
+
+# Per-process processor used by the ProcessPoolExecutor workers of process_files().
+_worker_processor: Optional[CommentProcessor] = None
+
+
+def _init_worker(config: CommentExtractorConfig, log_level: int) -> None:
+    global _worker_processor
+    # spawn/forkserver workers start with bare logging; forked ones inherit the parent's handlers.
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level, stream=sys.stdout, format="%(message)s")
+    _worker_processor = CommentProcessor(config)
+
+
+def _process_file_worker(
+    file_path: Path,
+) -> Tuple[Optional[Tuple[int, List[CommentMatch]]], Optional[str], Optional[Tuple[Tuple[int, int], Any]]]:
+    """Outcome plus the worker's cache entry, so the parent can cache it too."""
+    assert _worker_processor is not None
+    outcome, error = _worker_processor._process_file_safe(file_path)
+    cache = _worker_processor._cache
+    entry = cache.get(os.fspath(file_path)) if cache is not None else None
+    return outcome, error, entry
+
+
 def _configure_logging(log_file: Optional[Path], *, verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     handlers: List[logging.Handler] = []
@@ -13,16 +13,21 @@ Includes:
 
 from __future__ import annotations
 
+import codecs
 import fnmatch
 import logging
+import os
+import re
 import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Match, Optional, Sequence, Set, Tuple
 
 
 # ============================================================================
@@ -63,10 +68,77 @@ class FileType(Enum):
     UNKNOWN = "unknown"
 
 
+@lru_cache(maxsize=None)
+def _glob_matcher(pattern: str) -> Callable[[str], Optional[Match[str]]]:
+    """Compile a shell-style pattern once per process (fnmatch's own cache is bounded)."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _globmatch(name: str, pattern: str) -> bool:
+    """Case-sensitive glob match, equivalent to `fnmatch.fnmatchcase`."""
+    return _glob_matcher(pattern)(name) is not None
+
+
+def _glob_union(patterns: Iterable[str]) -> Optional[Callable[[str], Optional[Match[str]]]]:
+    """One matcher for "any of these globs" (None if there are none)."""
+    translated = [f"(?:{fnmatch.translate(p)})" for p in sorted(patterns)]
+    if not translated:
+        return None
+    return re.compile("|".join(translated)).match
+
+
 # ============================================================================
 # GitIgnore Parser (simplified semantics)
 # ============================================================================
 
+# Bytes detect_encoding reads; matches the chunk a text-mode read(2048) decodes.
+_ENCODING_SAMPLE_SIZE = 8192
+
+# FileSystemWalker lists a level's directories in parallel once it has this many.
+_WALK_WORKERS = 8
+_WALK_PARALLEL_MIN_DIRS = 4
+
+# Upper bound on GitIgnoreParser's per-path verdict cache.
+_GITIGNORE_CACHE_MAX = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class _GitIgnoreRuleGroup:
+    """
+    A run of consecutive rules with the same polarity, matched as one unit.
+
+    Within such a run it does not matter which rule matches first, so basename
+    globs are merged into one regex and bare directory names into one set.
+    """
+
+    negated: bool
+    name_match: Optional[Callable[[str], Optional[Match[str]]]]
+    dir_names: frozenset
+    other_patterns: Tuple[str, ...]
+
+
+def _build_rule_group(negated: bool, patterns: Sequence[str]) -> _GitIgnoreRuleGroup:
+    name_globs: List[str] = []
+    dir_names: Set[str] = set()
+    others: List[str] = []
+    for pattern in patterns:
+        if not pattern:
+            continue
+        if pattern.endswith("/"):
+            dir_pat = pattern.rstrip("/")
+            if "/" not in dir_pat.lstrip("/"):
+                dir_names.add(dir_pat.lstrip("/"))
+            else:
+                others.append(pattern)
+        elif "/" not in pattern.lstrip("/"):
+            name_globs.append(fnmatch.translate(pattern.lstrip("/")))
+        else:
+            others.append(pattern)
+
+    name_match = re.compile("|".join(name_globs)).match if name_globs else None
+    return _GitIgnoreRuleGroup(negated, name_match, frozenset(dir_names), tuple(others))
+
+
 class GitIgnoreParser:
     """
     Simplified .gitignore parser.
@@ -81,8 +153,14 @@ class GitIgnoreParser:
     def __init__(self, root_dir: Optional[Path] = None) -> None:
         self.root_dir = (root_dir or Path.cwd()).resolve()
         self.patterns: List[str] = []
-        # Tests expect cache keys to be exactly str(path)
+        # Tests expect cache keys to be exactly str(path); bounded, oldest entries evicted first
         self._cache: Dict[str, bool] = {}
+        # (negated, pattern) pairs, last pattern first; rebuilt by finalize()
+        self._rules: Tuple[Tuple[bool, str], ...] = ()
+        # The same rules merged into same-polarity groups, last group first.
+        self._groups: Tuple[_GitIgnoreRuleGroup, ...] = ()
+        # Copy of `patterns` the rules were built from; any difference triggers finalize().
+        self._finalized_patterns: List[str] = []
 
     def load_from_file(self, gitignore_path: Optional[Path] = None) -> bool:
         """
@@ -118,11 +196,12 @@ class GitIgnoreParser:
 
     def _parse_single_file(self, gitignore_path: Path) -> bool:
         try:
-            with open(gitignore_path, "r", encoding="utf-8") as f:
-                for raw_line in f:
-                    line = raw_line.strip()
-                    if not line or line.startswith("#"):
-                        continue
+            # One read and one split; gitignores are small and there may be many of them.
+            with open(gitignore_path, "rb") as f:
+                text = f.read().decode("utf-8")
+            for raw_line in text.splitlines():
+                line = raw_line.strip()
+                if line and not line.startswith("#"):
                     self.patterns.append(line)
             return True
         except Exception as e:
@@ -133,40 +212,97 @@ class GitIgnoreParser:
         self.patterns.append(pattern)
         self._cache.clear()
 
-    def should_ignore(self, path: Path) -> bool:
+    def finalize(self) -> None:
+        """
+        Pre-split negation markers once for all loaded patterns.
+
+        Called lazily by `should_ignore` whenever the pattern list changed, so one
+        parser can be shared by every root of a run without re-parsing per path.
+        """
+        snapshot = list(self.patterns)
+        rules = tuple(
+            (True, p[1:]) if p.startswith("!") else (False, p)
+            for p in reversed(snapshot)
+        )
+
+        groups: List[_GitIgnoreRuleGroup] = []
+        run: List[str] = []
+        for i, (negated, pat) in enumerate(rules):
+            run.append(pat)
+            if i + 1 == len(rules) or rules[i + 1][0] != negated:
+                groups.append(_build_rule_group(negated, run))
+                run = []
+
+        # should_ignore compares against the snapshot; publish it last so a walker thread
+        # never pairs the new snapshot with stale _rules/_groups.
+        self._groups = tuple(groups)
+        self._rules = rules
+        self._cache.clear()
+        self._finalized_patterns = snapshot
+
+    def should_ignore(self, path: Path, *, is_dir: Optional[bool] = None) -> bool:
         """
         Return True if path should be ignored based on loaded patterns.
 
         `path` is expected to be an absolute path or a path under root_dir.
+        Walkers that already know the entry type pass `is_dir` to save a stat.
         """
+        # Compared by content: `patterns` is public and may be edited in place or replaced.
+        # Checked before the cache, since finalize() drops verdicts made under old rules.
+        if self.patterns != self._finalized_patterns:
+            self.finalize()
+
         cache_key = str(path)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Nothing loaded: no rule can match, skip the stat and resolve() below.
+        if not self.patterns:
+            self._remember(cache_key, False)
+            return False
 
         # We intentionally use filesystem info; caller code walks real FS.
-        is_dir = path.is_dir()
+        if is_dir is None:
+            is_dir = path.is_dir()
 
         try:
             rel_path = path.resolve().relative_to(self.root_dir)
         except Exception:
             # Not under root -> by design return False, but still cache it (tests expect this)
-            self._cache[cache_key] = False
+            self._remember(cache_key, False)
             return False
 
         rel_str = rel_path.as_posix()
         rel_parts = rel_str.split("/") if rel_str else []
 
+        # The last matching pattern wins, so scan from the end and stop at the first hit.
+        name = rel_parts[-1] if rel_parts else ""
+        parents = rel_parts if is_dir else rel_parts[:-1]
         ignored = False
-        for pattern in self.patterns:
-            negated = pattern.startswith("!")
-            pat = pattern[1:] if negated else pattern
-
-            if self._match(rel_str, rel_parts, pat, is_dir=is_dir):
-                ignored = not negated
+        for group in self._groups:
+            if (
+                (group.name_match is not None and group.name_match(name) is not None)
+                or (group.dir_names and not group.dir_names.isdisjoint(parents))
+                or any(self._match(rel_str, rel_parts, pat, is_dir=is_dir) for pat in group.other_patterns)
+            ):
+                ignored = not group.negated
+                break
 
-        self._cache[cache_key] = ignored
+        self._remember(cache_key, ignored)
         return ignored
 
+    def _remember(self, cache_key: str, ignored: bool) -> None:
+        cache = self._cache
+        if len(cache) >= _GITIGNORE_CACHE_MAX:
+            # Walkers ask about each path about once, so FIFO eviction loses little.
+            # Tolerate a concurrent eviction from another scanning thread.
+            try:
+                del cache[next(iter(cache))]
+            except (KeyError, StopIteration, RuntimeError):
+                pass
+        cache[cache_key] = ignored
+
     def _match(self, rel_str: str, rel_parts: List[str], pattern: str, *, is_dir: bool) -> bool:
         """Match gitignore-like pattern against a relative posix path."""
         if not pattern:
@@ -200,7 +336,7 @@ class GitIgnoreParser:
         if "/" not in pattern.lstrip("/"):
             # Basename-style pattern: apply to file/dir name only
             name = rel_parts[-1] if rel_parts else ""
-            return fnmatch.fnmatchcase(name, pattern.lstrip("/"))
+            return _globmatch(name, pattern.lstrip("/"))
 
         # Path pattern (contains '/')
         anchored = pattern.startswith("/")
@@ -216,7 +352,7 @@ class GitIgnoreParser:
             if len(path_parts) < len(prefix_parts):
                 return False
             for i, pat in enumerate(prefix_parts):
-                if not fnmatch.fnmatchcase(path_parts[i], pat):
+                if not _globmatch(path_parts[i], pat):
                     return False
             return True
 
@@ -227,7 +363,7 @@ class GitIgnoreParser:
         for start in range(0, len(path_parts) - len(prefix_parts) + 1):
             ok = True
             for i, pat in enumerate(prefix_parts):
-                if not fnmatch.fnmatchcase(path_parts[start + i], pat):
+                if not _globmatch(path_parts[start + i], pat):
                     ok = False
                     break
             if ok:
@@ -250,7 +386,7 @@ class GitIgnoreParser:
                 j += 1
                 continue
 
-            if j < len(pat_parts) and fnmatch.fnmatchcase(path_parts[i], pat_parts[j]):
+            if j < len(pat_parts) and _globmatch(path_parts[i], pat_parts[j]):
                 i += 1
                 j += 1
                 continue
@@ -286,6 +422,13 @@ class FileSystemWalker:
             "directories_excluded": 0,
         }
         self._roots: List[Path] = []
+        self._compile_excludes()
+
+    def _compile_excludes(self) -> None:
+        """Freeze exclude_dirs and merge exclude_names / exclude_patterns into one regex each."""
+        self._exclude_dirs = frozenset(d for d in (self.config.exclude_dirs or ()) if d)
+        self._exclude_name_match = _glob_union(self.config.exclude_names or ())
+        self._exclude_pattern_match = _glob_union(self.config.exclude_patterns or ())
 
     def find_files(self, root_dirs: Sequence[Path], *, recursive: Optional[bool] = None) -> List[Path]:
         """
@@ -296,6 +439,7 @@ class FileSystemWalker:
         """
         self._roots = [p.resolve() for p in root_dirs]
         self._reset_stats()
+        self._compile_excludes()
 
         do_recursive = self.config.recursive if recursive is None else recursive
 
@@ -329,94 +473,176 @@ class FileSystemWalker:
 
         Depth convention:
         - root_dir children (files/dirs directly inside) are at depth=1
+
+        Directories are walked level by level; wide levels are listed by a thread
+        pool (scandir releases the GIL), stats are only updated on this thread.
         """
         results: List[Path] = []
-        stack: List[Tuple[Path, int]] = [(root_dir, 0)]  # (dir, depth_of_dir)
+        max_depth = self.config.max_depth
+        # A child directory's parts are its parent's parts plus its name, and parents that
+        # failed exclude_dirs are never descended into; only the root's own parts remain.
+        root_excluded = not self._exclude_dirs.isdisjoint(root_dir.parts)
+        stats = self.stats
 
-        while stack:
-            current_dir, depth = stack.pop()
+        def scan(item: Tuple[Path, int]) -> Tuple[List[Path], List[Path], List[int]]:
+            return self._scan_directory(item[0], item[1], root_excluded=root_excluded)
 
-            if self.config.max_depth is not None and depth > self.config.max_depth:
-                continue
+        executor: Optional[ThreadPoolExecutor] = None
+        level: List[Tuple[Path, int]] = [(root_dir, 0)]  # (dir, depth_of_dir)
+        try:
+            while level:
+                if max_depth is not None:
+                    level = [(d, depth) for d, depth in level if depth <= max_depth]
+
+                if len(level) >= _WALK_PARALLEL_MIN_DIRS:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=_WALK_WORKERS)
+                    scanned = executor.map(scan, level)
+                else:
+                    scanned = map(scan, level)
+
+                next_level: List[Tuple[Path, int]] = []
+                for (_d, depth), (files, subdirs, counts) in zip(level, scanned):
+                    results.extend(files)
+                    next_level.extend((sub, depth + 1) for sub in subdirs)
+                    stats["files_found"] += counts[0]
+                    stats["files_excluded"] += counts[1]
+                    stats["directories_found"] += counts[2]
+                    stats["directories_excluded"] += counts[3]
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-            try:
-                for item in current_dir.iterdir():
-                    if item.is_symlink() and not self.config.follow_symlinks:
-                        continue
+        return results
+
+    def _scan_directory(
+        self,
+        current_dir: Path,
+        depth: int,
+        *,
+        root_excluded: bool,
+    ) -> Tuple[List[Path], List[Path], List[int]]:
+        """
+        List one directory: (kept files, subdirectories to descend into, counts).
 
-                    if item.is_symlink() and self.config.follow_symlinks:
+        counts = [files_found, files_excluded, directories_found, directories_excluded].
+        Safe to run in a worker thread; touches no shared walker state.
+        """
+        files: List[Path] = []
+        subdirs: List[Path] = []
+        counts = [0, 0, 0, 0]
+        include = self.config.include_pattern
+        excl_dirs = self._exclude_dirs
+        files_too_deep = self.config.max_depth is not None and (depth + 1) > self.config.max_depth
+        try:
+            # scandir reports entry types from the directory listing, no stat per entry.
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        if not self.config.follow_symlinks:
+                            continue
                         try:
-                            item = item.resolve()
+                            item = Path(entry.path).resolve()
                         except Exception:
                             continue
+                        is_dir = item.is_dir()
+                    elif entry.is_dir():
+                        # exclude_dirs names are literals: prune on the entry name alone.
+                        if excl_dirs and (root_excluded or entry.name in excl_dirs):
+                            counts[2] += 1
+                            counts[3] += 1
+                            continue
+                        item = Path(entry.path)
+                        is_dir = True
+                    else:
+                        # Plain files: depth and include checks use the entry name only,
+                        # so rejected files never get a Path object.
+                        counts[0] += 1
+                        if files_too_deep or not _globmatch(entry.name, include):
+                            counts[1] += 1
+                            continue
+                        item = Path(entry.path)
+                        if self._excluded_by_rules(item, is_dir=False):
+                            counts[1] += 1
+                            continue
+                        files.append(item)
+                        continue
 
-                    if item.is_dir():
-                        self.stats["directories_found"] += 1
+                    if is_dir:
+                        counts[2] += 1
                         if self._should_exclude(item, is_dir=True):
-                            self.stats["directories_excluded"] += 1
+                            counts[3] += 1
                             continue
-                        stack.append((item, depth + 1))
+                        subdirs.append(item)
                         continue
 
-                    self.stats["files_found"] += 1
+                    counts[0] += 1
 
-                    if self.config.max_depth is not None and (depth + 1) > self.config.max_depth:
-                        self.stats["files_excluded"] += 1
+                    if files_too_deep:
+                        counts[1] += 1
                         continue
 
                     if self._should_exclude(item, is_dir=False):
-                        self.stats["files_excluded"] += 1
+                        counts[1] += 1
                         continue
 
-                    results.append(item)
+                    files.append(item)
 
-            except PermissionError:
-                logging.debug("Permission denied: %s", current_dir)
-            except Exception as e:
-                logging.debug("Error accessing %s: %s", current_dir, e)
+        except PermissionError:
+            logging.debug("Permission denied: %s", current_dir)
+        except Exception as e:
+            logging.debug("Error accessing %s: %s", current_dir, e)
 
-        return results
+        return files, subdirs, counts
 
     def _walk_single(self, directory: Path) -> List[Path]:
         """Walk a single directory (non-recursive)."""
         results: List[Path] = []
+        include = self.config.include_pattern
         try:
-            for item in directory.iterdir():
-                if not item.is_file():
-                    continue
-                self.stats["files_found"] += 1
-                if self._should_exclude(item, is_dir=False):
-                    self.stats["files_excluded"] += 1
-                    continue
-                results.append(item)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    self.stats["files_found"] += 1
+                    if not _globmatch(entry.name, include):
+                        self.stats["files_excluded"] += 1
+                        continue
+                    item = Path(entry.path)
+                    if self._excluded_by_rules(item, is_dir=False):
+                        self.stats["files_excluded"] += 1
+                        continue
+                    results.append(item)
         except PermissionError:
             logging.debug("Permission denied: %s", directory)
         return results
 
     def _should_exclude(self, path: Path, *, is_dir: bool) -> bool:
         """Return True if path should be excluded by config/gitignore rules."""
-        if self.gitignore_parser and self.gitignore_parser.should_ignore(path):
+        # Cheap name-only check before any gitignore or relative-path work.
+        if not is_dir and not _globmatch(path.name, self.config.include_pattern):
             return True
+        return self._excluded_by_rules(path, is_dir=is_dir)
 
-        if is_dir and self.config.exclude_dirs:
-            for d in self.config.exclude_dirs:
-                if d and d in path.parts:
-                    return True
-
-        if self.config.exclude_names:
-            for pat in self.config.exclude_names:
-                if fnmatch.fnmatchcase(path.name, pat):
-                    return True
+    def _excluded_by_rules(self, path: Path, *, is_dir: bool) -> bool:
+        """Gitignore and exclude_* checks, for paths that already passed include_pattern."""
+        if self.gitignore_parser and self.gitignore_parser.should_ignore(path, is_dir=is_dir):
+            return True
 
-        if self.config.exclude_patterns:
-            rel = self._relative_to_nearest_root(path).as_posix()
-            for pat in self.config.exclude_patterns:
-                if fnmatch.fnmatchcase(path.name, pat) or fnmatch.fnmatchcase(rel, pat):
-                    return True
+        if is_dir and self._exclude_dirs and not self._exclude_dirs.isdisjoint(path.parts):
+            return True
 
-        if not is_dir and not fnmatch.fnmatchcase(path.name, self.config.include_pattern):
+        name_match = self._exclude_name_match
+        if name_match is not None and name_match(path.name):
             return True
 
+        pattern_match = self._exclude_pattern_match
+        if pattern_match is not None:
+            if pattern_match(path.name):
+                return True
+            if pattern_match(self._relative_to_nearest_root(path).as_posix()):
+                return True
         return False
 
     def _relative_to_nearest_root(self, path: Path) -> Path:
@@ -507,19 +733,24 @@ class FileContentDetector:
         """
         Detect file encoding with a simple trial strategy.
 
-        Returns one of the tried encodings; falls back to latin-1 (never fails).
+        Checks one raw sample as strict UTF-8; otherwise falls back to latin-1,
+        which decodes any byte sequence (never fails).
         """
-        encodings = ("utf-8", "latin-1", "cp1252", "utf-16")
-        for enc in encodings:
-            try:
-                with open(path, "r", encoding=enc) as f:
-                    f.read(2048)
-                return enc
-            except UnicodeDecodeError:
-                continue
-            except Exception:
-                return "utf-8"
-        return "latin-1"
+        try:
+            with open(path, "rb") as f:
+                sample = f.read(_ENCODING_SAMPLE_SIZE)
+        except Exception:
+            return "utf-8"
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            text = decoder.decode(sample)
+            # A sequence cut at EOF only counts when the sample is short of 2048 chars,
+            # as with the text-mode read(2048) this replaces.
+            if len(sample) < _ENCODING_SAMPLE_SIZE and len(text) < 2048:
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
 
 
 # ============================================================================
@@ -534,6 +765,10 @@ class SafeFileProcessor:
     - If backup=True and file exists, creates <name><suffix>.bak
     - If exception occurs inside context, restores original from backup
     - On success, removes backup unless keep_backup=True
+
+    With backup=True, `original_content` is read from the backup on first access.
+    Read it inside the context if needed: after a successful run without keep_backup
+    the backup is gone and it is None.
     """
 
     def __init__(self, file_path: Path, *, backup: bool = True, keep_backup: bool = False) -> None:
@@ -542,32 +777,56 @@ class SafeFileProcessor:
         self.keep_backup = keep_backup
         self.backup_path: Optional[Path] = None
         # Tests expect this attribute to exist
-        self.original_content: Optional[str] = None
+        self._original_content: Optional[str] = None
+        self._original_loaded = False
+
+    @property
+    def original_content(self) -> Optional[str]:
+        """Original text; read from the backup on first access, None once it is removed."""
+        if not self._original_loaded:
+            self._original_loaded = True
+            if self.backup_path is not None:
+                self._original_content = self._read_text(self.backup_path)
+        return self._original_content
+
+    @original_content.setter
+    def original_content(self, value: Optional[str]) -> None:
+        self._original_content = value
+        self._original_loaded = True
+
+    def _load_original(self) -> None:
+        """Read original_content before a failed run renames the backup over the file."""
+        _ = self.original_content
+
+    @staticmethod
+    def _read_text(path: Path) -> Optional[str]:
+        try:
+            return path.read_text(encoding="utf-8")
+        except Exception:
+            return None
 
     def __enter__(self) -> "SafeFileProcessor":
-        if self.file_path.exists():
-            try:
-                self.original_content = self.file_path.read_text(encoding="utf-8")
-            except Exception:
-                self.original_content = None
+        if not self.file_path.exists():
+            return self
 
-        if self.backup and self.file_path.exists():
+        if self.backup:
+            # The backup holds the original bytes; original_content is read from it lazily.
             self.backup_path = self.file_path.with_suffix(self.file_path.suffix + ".bak")
             shutil.copy2(self.file_path, self.backup_path)
+        else:
+            self.original_content = self._read_text(self.file_path)
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
         # Restore from backup on error
         if exc_type is not None and self.backup_path and self.backup_path.exists():
-            try:
+            if self.keep_backup:
                 shutil.copy2(self.backup_path, self.file_path)
-            finally:
-                if not self.keep_backup:
-                    try:
-                        self.backup_path.unlink(missing_ok=True)
-                    except Exception:
-                        pass
+            else:
+                self._load_original()
+                # Renaming the backup over the file restores it atomically without a copy.
+                os.replace(self.backup_path, self.file_path)
             logging.error("Error processing %s. Restored from backup.", self.file_path)
             return False  # re-raise
 
@@ -603,12 +862,14 @@ def safe_write(
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with SafeFileProcessor(file_path, backup=backup, keep_backup=keep_backup):
+        # Without a backup the context manager has nothing to restore; skip its extra
+        # read of the original file, which doubles the I/O of bulk rewrites.
+        guard = SafeFileProcessor(file_path, backup=True, keep_backup=keep_backup) if backup else nullcontext()
+        with guard:
             with open(tmp_path, "w", encoding=encoding, newline="") as f:
                 f.write(content)
                 f.flush()
                 try:
-                    import os
                     os.fsync(f.fileno())
                 except Exception:
                     pass
@@ -639,6 +900,7 @@ class ProgressReporter:
         self.current = 0
         self.start_time: Optional[float] = None
         self.stream = stream or sys.stdout
+        self._last_tenths = 0
 
         try:
             self._isatty = bool(self.stream.isatty())
@@ -650,6 +912,7 @@ class ProgressReporter:
 
     def __enter__(self) -> "ProgressReporter":
         self.start_time = time.time()
+        self._last_tenths = 0
         self._print_progress()
         return self
 
@@ -674,6 +937,11 @@ class ProgressReporter:
         if self.total <= 0:
             return
         self.current = min(self.total, self.current + max(0, int(increment)))
+        # Only write when the shown 0.1% step moves; __exit__ always prints the final line.
+        tenths = self.current * 1000 // self.total
+        if tenths == self._last_tenths:
+            return
+        self._last_tenths = tenths
         self._print_progress()
 
     def _print_progress(self, *, final: bool = False) -> None:
@@ -705,18 +973,18 @@ class ProgressReporter:
 # Utility Functions
 # ============================================================================
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(size_bytes: int) -> str:
     """Format byte size in a human-readable form."""
     if size_bytes <= 0:
         return "0 B"
 
-    units = ("B", "KB", "MB", "GB", "TB")
-    size = float(size_bytes)
-    unit_idx = 0
-    while size >= 1024.0 and unit_idx < len(units) - 1:
-        size /= 1024.0
-        unit_idx += 1
-    return f"{size:.2f} {units[unit_idx]}"
+    # bit_length gives floor(log2) without float math; each unit is 10 bits.
+    unit_idx = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (10 * unit_idx))
+    return f"{size:.2f} {_SIZE_UNITS[unit_idx]}"
 
 
 def get_relative_path(path: Path, base_dir: Optional[Path] = None) -> str:
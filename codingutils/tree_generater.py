@@ -14,13 +14,16 @@ import argparse
 import fnmatch
 import json
 import logging
+import os
+import re
 import stat as stat_module
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
 from xml.etree import ElementTree as ET
 
 from codingutils.common_utils import (
@@ -34,6 +37,17 @@ from codingutils.common_utils import (
 logger = logging.getLogger(__name__)
 
 
+# Sibling directories are scanned concurrently; listing/stat syscalls release the GIL.
+_SCAN_WORKERS = 8
+_PARALLEL_MIN_DEPTH = 2
+
+
+def _combine_globs(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    """Compile shell-style patterns into one alternation regex (None if empty)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
 
 @dataclass(slots=True)
 class TreeConfig(FilterConfig):
@@ -100,6 +114,15 @@ class TreeNode:
     is_symlink: bool = False
 
 
+# Sort keys are picked once per tree rather than branching on sort_by per node.
+_SORT_KEYS: Dict[str, Callable[[TreeNode], Tuple[Any, ...]]] = {
+    "name": lambda n: (not n.is_dir, n.name.lower()),
+    "size": lambda n: (not n.is_dir, n.size, n.name.lower()),
+    "modified": lambda n: (not n.is_dir, n.last_modified, n.name.lower()),
+    "type": lambda n: (not n.is_dir, n.path.suffix.lower(), n.name.lower()),
+}
+
+
 class NodeFilter:
     """
     Filtering logic compatible with FilterConfig semantics (plus additional hidden filtering).
@@ -114,64 +137,106 @@ class NodeFilter:
         self.config = config
         self.gitignore = gitignore
         self.root = root.resolve()
+        self._root_str = str(self.root)
+        self._root_prefix = self._root_str.rstrip(os.sep) + os.sep
+
+        self._excl_dirs = frozenset(config.exclude_dirs or ())
+        self._excl_names = tuple(config.exclude_names or ())
+        self._excl_patterns = tuple(config.exclude_patterns or ())
+
+        self._excl_name_re = _combine_globs(self._excl_names)
+        self._excl_pat_re = _combine_globs(self._excl_patterns)
+
+        # The default "*" accepts every file name, so no matcher is bound for it.
+        self._include_match: Optional[Callable[[str], Any]] = (
+            None if config.include_pattern == "*" else re.compile(fnmatch.translate(config.include_pattern)).match
+        )
+
+        # Verdicts for directories already checked, keyed by str(path).  A child of an
+        # included directory only needs its own name checked for hidden/exclude_dirs.
+        self._dir_verdicts: Dict[str, bool] = {}
+
+    def _fast_rel(self, path: Path) -> Optional[str]:
+        """Root-relative posix path by string slicing; None when `path` is not spelled under root."""
+        path_str = str(path)
+        if path_str == self._root_str:
+            return "."
+        if not path_str.startswith(self._root_prefix):
+            return None
+        rel = path_str[len(self._root_prefix):]
+        return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+    def _rel_parts(self, path: Path) -> Tuple[str, ...]:
+        rel = self._fast_rel(path)
+        if rel is not None:
+            return () if rel == "." else tuple(rel.split("/"))
+        try:
+            return path.resolve().relative_to(self.root).parts
+        except Exception:
+            return path.parts
 
     def _safe_rel(self, path: Path) -> str:
+        rel = self._fast_rel(path)
+        if rel is not None:
+            return rel
         try:
             return path.resolve().relative_to(self.root).as_posix()
         except Exception:
             return path.as_posix()
 
     def is_hidden_path(self, path: Path) -> bool:
-
-        try:
-            rel = path.resolve().relative_to(self.root)
-            parts = rel.parts
-        except Exception:
-            parts = path.parts
-        return any(p.startswith(".") for p in parts if p)
+        return any(p.startswith(".") for p in self._rel_parts(path) if p)
 
     def should_include(self, path: Path, *, is_dir: bool) -> bool:
-        cfg = self.config
-
+        included = self._should_include(path, is_dir=is_dir)
+        if is_dir:
+            self._dir_verdicts[str(path)] = included
+        return included
+
+    def _should_include(self, path: Path, *, is_dir: bool) -> bool:
+        name = path.name
+        excl_dirs = self._excl_dirs
+        excl_name_re = self._excl_name_re
+        excl_pat_re = self._excl_pat_re
+        include_match = self._include_match
+        gitignore = self.gitignore
+
+        # Cheapest rejection first: one regex call on the name, no path work.
+        if not is_dir and include_match is not None and include_match(name) is None:
+            return False
 
-        if not cfg.show_hidden and self.is_hidden_path(path):
+        parent_verdict = self._dir_verdicts.get(str(path.parent))
+        if parent_verdict is False:
             return False
 
+        # The parent's own parts already passed these checks, only the name is new.
+        own_parts: Sequence[str] = (name,) if parent_verdict else self._rel_parts(path)
 
-        if self.gitignore is not None and self.gitignore.should_ignore(path):
+
+        if not self.config.show_hidden and any(p.startswith(".") for p in own_parts if p):
             return False
 
 
-        if is_dir and cfg.exclude_dirs:
-            try:
-                rel_parts = path.resolve().relative_to(self.root).parts
-            except Exception:
-                rel_parts = path.parts
-            if any(seg in cfg.exclude_dirs for seg in rel_parts):
-                return False
+        if gitignore is not None and gitignore.should_ignore(path, is_dir=is_dir):
+            return False
 
 
-        if cfg.exclude_names:
-            for pat in cfg.exclude_names:
-                if fnmatch.fnmatchcase(path.name, pat):
-                    return False
+        if is_dir and excl_dirs and not excl_dirs.isdisjoint(own_parts):
+            return False
 
 
-        if cfg.exclude_patterns:
-            rel_str = self._safe_rel(path)
-            for pat in cfg.exclude_patterns:
-                if fnmatch.fnmatchcase(path.name, pat) or fnmatch.fnmatchcase(rel_str, pat):
-                    return False
+        if excl_name_re is not None and excl_name_re.match(name):
+            return False
 
 
-                if is_dir:
-                    probe = rel_str.rstrip("/") + "/__x__"
-                    if fnmatch.fnmatchcase(probe, pat):
-                        return False
+        if excl_pat_re is not None:
+            rel_str = self._safe_rel(path)
+            if excl_pat_re.match(name) or excl_pat_re.match(rel_str):
+                return False
 
 
-        if not is_dir and not fnmatch.fnmatchcase(path.name, cfg.include_pattern):
-            return False
+            if is_dir and excl_pat_re.match(rel_str.rstrip("/") + "/__x__"):
+                return False
 
         return True
 
@@ -244,11 +309,13 @@ class TreeBuilder:
         root_node = self._make_node(root, is_dir=True)
         self.stats["directories"] += 1
 
-        if self.config.recursive:
-            self._populate_children(root_node, nf=nf, current_depth=0)
+        max_depth = self.config.max_depth
+        if self.config.recursive and (max_depth is None or max_depth > _PARALLEL_MIN_DEPTH):
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                self._populate_tree(root_node, nf=nf, scan_map=executor.map, allow_descend=True)
         else:
 
-            self._populate_children(root_node, nf=nf, current_depth=0, allow_descend=False)
+            self._populate_tree(root_node, nf=nf, scan_map=map, allow_descend=self.config.recursive)
 
         self._sort_tree(root_node)
 
@@ -256,83 +323,107 @@ class TreeBuilder:
             return None
         return root_node
 
-    def _populate_children(
+    def _populate_tree(
         self,
-        node: TreeNode,
+        root_node: TreeNode,
         *,
         nf: NodeFilter,
-        current_depth: int,
-        allow_descend: bool = True,
+        scan_map: Callable[..., Iterable[Tuple[List[TreeNode], int]]],
+        allow_descend: bool,
     ) -> None:
+        """
+        Breadth-first walk: every directory of a level is scanned via `scan_map`
+        (a thread pool map for large trees), stats are only updated here.
+        """
         cfg = self.config
-        if not node.is_dir:
-            return
-
-
-        if allow_descend and cfg.max_depth is not None and current_depth >= cfg.max_depth:
-            return
+        stats = self.stats
+        visited: List[TreeNode] = []
+
+        level: List[Tuple[TreeNode, int]] = [(root_node, 0)]
+        while level:
+            if allow_descend and cfg.max_depth is not None:
+                level = [(n, d) for n, d in level if d < cfg.max_depth]
+
+            next_level: List[Tuple[TreeNode, int]] = []
+            results = scan_map(lambda item: self._scan_children(item[0], nf=nf), level)
+            for (node, depth), (children, excluded) in zip(level, results):
+                stats["excluded_items"] += excluded
+                node.children = children
+                visited.append(node)
+
+                for child in children:
+                    if child.is_dir:
+                        stats["directories"] += 1
+                        if allow_descend:
+                            next_level.append((child, depth + 1))
+                    else:
+                        stats["files"] += 1
+                        stats["total_size"] += child.size
+
+            level = next_level
+
+        if cfg.exclude_empty_dirs:
+
+            for node in reversed(visited):
+                for c in node.children:
+                    if c.is_dir and not c.children:
+                        stats["directories"] -= 1
+                node.children = [c for c in node.children if not c.is_dir or c.children]
+
+    def _scan_children(self, node: TreeNode, *, nf: NodeFilter) -> Tuple[List[TreeNode], int]:
+        """List, filter and stat one directory. Safe to run in a worker thread."""
+        cfg = self.config
+        excluded = 0
 
         try:
-            entries = list(node.path.iterdir())
-        except Exception:
-            self.stats["excluded_items"] += 1
-            return
-
+            with os.scandir(node.path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Cannot list %s: %s", node.path, e)
+            return [], 1
+
+        follow_symlinks = cfg.follow_symlinks
+        should_include = nf.should_include
+        make_node = self._make_node
         children: List[TreeNode] = []
+        append = children.append
         for entry in entries:
 
+            # DirEntry answers from d_type; only a vanished entry or a broken link raises here.
             try:
-                is_symlink = entry.is_symlink()
-            except Exception:
-                is_symlink = False
-
-            if is_symlink and not cfg.follow_symlinks:
-                self.stats["excluded_items"] += 1
+                if entry.is_symlink():
+                    if not follow_symlinks:
+                        excluded += 1
+                        continue
+                    real_path = Path(entry.path).resolve()
+                    is_dir = real_path.is_dir()
+                else:
+                    real_path = Path(entry.path)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+            except (OSError, RuntimeError):
+                excluded += 1
                 continue
 
-            real_path = entry
-            if is_symlink and cfg.follow_symlinks:
-                try:
-                    real_path = entry.resolve()
-                except Exception:
-                    self.stats["excluded_items"] += 1
-                    continue
-
-            try:
-                is_dir = real_path.is_dir()
-            except Exception:
-                self.stats["excluded_items"] += 1
-                continue
-
-            if not nf.should_include(real_path, is_dir=is_dir):
-                self.stats["excluded_items"] += 1
+            if not should_include(real_path, is_dir=is_dir):
+                excluded += 1
                 continue
 
-            child = self._make_node(real_path, is_dir=is_dir)
-            children.append(child)
+            # Resolved/walked paths are never links themselves; skip the extra lstat.
+            append(make_node(real_path, is_dir=is_dir, is_symlink=False))
 
-            if is_dir:
-                self.stats["directories"] += 1
-                if allow_descend:
-                    self._populate_children(child, nf=nf, current_depth=current_depth + 1, allow_descend=True)
+        return children, excluded
 
-                if cfg.exclude_empty_dirs and not child.children:
-                    children.pop()
-                    self.stats["directories"] -= 1
-            else:
-                self.stats["files"] += 1
-                self.stats["total_size"] += child.size
-
-        node.children = children
-
-    def _make_node(self, path: Path, *, is_dir: bool) -> TreeNode:
+    def _make_node(self, path: Path, *, is_dir: bool, is_symlink: Optional[bool] = None) -> TreeNode:
         cfg = self.config
         node = TreeNode(name=path.name or str(path), path=path, is_dir=is_dir)
 
-        try:
-            node.is_symlink = path.is_symlink()
-        except Exception:
-            node.is_symlink = False
+        if is_symlink is not None:
+            node.is_symlink = is_symlink
+        else:
+            try:
+                node.is_symlink = path.is_symlink()
+            except Exception:
+                node.is_symlink = False
 
 
         need_stat = (
@@ -365,32 +456,40 @@ class TreeBuilder:
         return FileContentDetector.detect_file_type(path)
 
     def _sort_tree(self, node: TreeNode) -> None:
-        self._sort_children(node)
-        for c in node.children:
-            if c.is_dir:
-                self._sort_tree(c)
-
-    def _sort_children(self, node: TreeNode) -> None:
-        key = self.config.sort_by
+        key = _SORT_KEYS.get(self.config.sort_by, _SORT_KEYS["name"])
         reverse = self.config.sort_reverse
 
-        def sk(n: TreeNode):
-            if key == "name":
-                return (not n.is_dir, n.name.lower())
-            if key == "size":
-                return (not n.is_dir, n.size, n.name.lower())
-            if key == "modified":
-                return (not n.is_dir, n.last_modified, n.name.lower())
-            if key == "type":
-                return (not n.is_dir, n.path.suffix.lower(), n.name.lower())
-            return (not n.is_dir, n.name.lower())
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.children.sort(key=key, reverse=reverse)
+            stack.extend(c for c in current.children if c.is_dir)
 
-        node.children.sort(key=sk, reverse=reverse)
 
 
 
 
 
+def _terminated_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Stream `lines` newline-terminated, equivalent to "\\n".join(lines).rstrip() + "\\n".
+
+    Blank lines are held back until a non-blank one follows so trailing ones can be dropped.
+    """
+    last: Optional[str] = None
+    pending: List[str] = []
+    for line in lines:
+        if not line.strip():
+            pending.append(line)
+            continue
+        if last is not None:
+            yield last + "\n"
+        for blank in pending:
+            yield blank + "\n"
+        pending.clear()
+        last = line
+    yield (last.rstrip() if last is not None else "") + "\n"
+
 
 class Renderer:
     def __init__(self, config: TreeConfig) -> None:
@@ -399,6 +498,10 @@ class Renderer:
     def render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> str:
         raise NotImplementedError
 
+    def iter_render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> Iterator[str]:
+        """Yield the rendered output in chunks; line-based renderers override this to stream."""
+        yield self.render(root, stats=stats, roots=roots)
+
     def _truncate(self, s: str) -> str:
         w = self.config.max_width
         if w is None or w <= 0:
@@ -412,16 +515,19 @@ class Renderer:
 
 class TextRenderer(Renderer):
     def render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> str:
-        lines: List[str] = []
-        lines.extend(self._header(roots))
-        self._render_node(root, prefix="", is_last=True, depth=0, lines=lines)
+        return "".join(self.iter_render(root, stats=stats, roots=roots))
+
+    def iter_render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> Iterator[str]:
+        return _terminated_lines(self._iter_lines(root, stats=stats, roots=roots))
+
+    def _iter_lines(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> Iterator[str]:
+        yield from self._header(roots)
+        yield from self._iter_tree(root)
 
         if self.config.include_statistics:
-            lines.extend(self._stats(stats))
+            yield from self._stats(stats)
         if self.config.include_summary:
-            lines.extend(self._summary(stats))
-
-        return "\n".join(lines).rstrip() + "\n"
+            yield from self._summary(stats)
 
     def _header(self, roots: Sequence[Path]) -> List[str]:
         cfg = self.config
@@ -442,28 +548,42 @@ class TextRenderer(Renderer):
         out.append("=" * 60)
         return out
 
-    def _render_node(self, node: TreeNode, *, prefix: str, is_last: bool, depth: int, lines: List[str]) -> None:
-
-        if node.name == "COMBINED VIEW" and node.path == Path.cwd().resolve():
-            for i, child in enumerate(node.children):
-                self._render_node(child, prefix="", is_last=(i == len(node.children) - 1), depth=0, lines=lines)
-            return
+    def _iter_tree(self, root: TreeNode) -> Iterator[str]:
+        """Depth-first render with an explicit stack (children pushed in reverse)."""
+        cfg = self.config
+        indent_style = cfg.indent_style
+        indent_size = cfg.indent_size
+        space = cfg.tree_symbols["space"]
+        vertical = cfg.tree_symbols["vertical"]
+        truncate = self._truncate
+        format_line = self._format_line
+
+        stack: List[Tuple[TreeNode, str, bool, int]] = []
+        if root.name == "COMBINED VIEW" and root.path == Path.cwd().resolve():
+            last = len(root.children) - 1
+            for i in range(last, -1, -1):
+                stack.append((root.children[i], "", i == last, 0))
+        else:
+            stack.append((root, "", True, 0))
 
-        line = self._format_line(node, prefix=prefix, is_last=is_last, depth=depth)
-        lines.append(self._truncate(line))
+        while stack:
+            node, prefix, is_last, depth = stack.pop()
+            yield truncate(format_line(node, prefix=prefix, is_last=is_last, depth=depth))
 
-        if not node.is_dir or not node.children:
-            return
+            children = node.children
+            if not node.is_dir or not children:
+                continue
 
-        if self.config.indent_style == "tree":
-            next_prefix = prefix + (self.config.tree_symbols["space"] if is_last else self.config.tree_symbols["vertical"])
-        elif self.config.indent_style == "spaces":
-            next_prefix = " " * (self.config.indent_size * (depth + 1))
-        else:
-            next_prefix = "-" * (self.config.indent_size * (depth + 1)) + " "
+            if indent_style == "tree":
+                next_prefix = prefix + (space if is_last else vertical)
+            elif indent_style == "spaces":
+                next_prefix = " " * (indent_size * (depth + 1))
+            else:
+                next_prefix = "-" * (indent_size * (depth + 1)) + " "
 
-        for i, child in enumerate(node.children):
-            self._render_node(child, prefix=next_prefix, is_last=(i == len(node.children) - 1), depth=depth + 1, lines=lines)
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], next_prefix, i == last, depth + 1))
 
     def _format_line(self, node: TreeNode, *, prefix: str, is_last: bool, depth: int) -> str:
         name = self._display_name(node)
@@ -539,49 +659,53 @@ class TextRenderer(Renderer):
 
 class MarkdownRenderer(Renderer):
     def render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> str:
-        lines: List[str] = []
-        lines.append("# Project Structure")
-        lines.append("")
+        return "".join(self.iter_render(root, stats=stats, roots=roots))
+
+    def iter_render(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> Iterator[str]:
+        return _terminated_lines(map(self._truncate, self._iter_lines(root, stats=stats, roots=roots)))
+
+    def _iter_lines(self, root: TreeNode, *, stats: Dict[str, Any], roots: Sequence[Path]) -> Iterator[str]:
+        yield "# Project Structure"
+        yield ""
         for p in roots:
-            lines.append(f"- Root: `{Path(p).resolve()}`")
-        lines.append("")
-        self._render_node(root, level=0, lines=lines)
+            yield f"- Root: `{Path(p).resolve()}`"
+        yield ""
+        yield from self._iter_tree(root)
 
         if self.config.include_statistics:
             elapsed = max(0.0, float(stats["end_time"]) - float(stats["start_time"]))
-            lines.append("")
-            lines.append("## Statistics")
-            lines.append(f"- Directories: {stats['directories']}")
-            lines.append(f"- Files: {stats['files']}")
-            lines.append(f"- Total size: {format_size(int(stats['total_size']))}")
-            lines.append(f"- Excluded: {stats['excluded_items']}")
-            lines.append(f"- Time: {elapsed:.2f}s")
-
-        lines = [self._truncate(ln) for ln in lines]
-        return "\n".join(lines).rstrip() + "\n"
-
-    def _render_node(self, node: TreeNode, *, level: int, lines: List[str]) -> None:
-        if node.name == "COMBINED VIEW" and node.path == Path.cwd().resolve():
-            for child in node.children:
-                self._render_node(child, level=0, lines=lines)
-            return
-
-        indent = "  " * level
-        label = node.name + ("/" if node.is_dir else "")
+            yield ""
+            yield "## Statistics"
+            yield f"- Directories: {stats['directories']}"
+            yield f"- Files: {stats['files']}"
+            yield f"- Total size: {format_size(int(stats['total_size']))}"
+            yield f"- Excluded: {stats['excluded_items']}"
+            yield f"- Time: {elapsed:.2f}s"
+
+    def _iter_tree(self, root: TreeNode) -> Iterator[str]:
+        stack: List[Tuple[TreeNode, int]]
+        if root.name == "COMBINED VIEW" and root.path == Path.cwd().resolve():
+            stack = [(c, 0) for c in reversed(root.children)]
+        else:
+            stack = [(root, 0)]
 
-        meta: List[str] = []
-        if not node.is_dir:
-            if self.config.show_last_modified and node.last_modified:
-                meta.append(datetime.fromtimestamp(node.last_modified).strftime("%Y-%m-%d"))
-            if self.config.show_size:
-                meta.append(format_size(node.size))
+        while stack:
+            node, level = stack.pop()
+            indent = "  " * level
+            label = node.name + ("/" if node.is_dir else "")
 
-        if meta:
-            label += " (" + ", ".join(meta) + ")"
+            meta: List[str] = []
+            if not node.is_dir:
+                if self.config.show_last_modified and node.last_modified:
+                    meta.append(datetime.fromtimestamp(node.last_modified).strftime("%Y-%m-%d"))
+                if self.config.show_size:
+                    meta.append(format_size(node.size))
 
-        lines.append(f"{indent}- {label}")
-        for c in node.children:
-            self._render_node(c, level=level + 1, lines=lines)
+            if meta:
+                label += " (" + ", ".join(meta) + ")"
+
+            yield f"{indent}- {label}"
+            stack.extend((c, level + 1) for c in reversed(node.children))
 
 
 class JsonRenderer(Renderer):
@@ -700,6 +824,7 @@ class ProjectTreeGenerator:
             parser.load_from_file(self.config.custom_gitignore)
         else:
             parser.load_from_file()
+        parser.finalize()
         return parser
 
     def _create_renderer(self) -> Renderer:
@@ -712,6 +837,14 @@ class ProjectTreeGenerator:
         return TextRenderer(self.config)
 
     def generate(self, roots: Sequence[Path]) -> str:
+        return "".join(self.iter_generate(roots))
+
+    def iter_generate(self, roots: Sequence[Path]) -> Iterator[str]:
+        """
+        Build the tree now and return its rendering as a stream of chunks.
+
+        Errors about missing roots are raised here, before anything is written.
+        """
         valid_roots: List[Path] = []
         for p in roots:
             rp = Path(p).resolve()
@@ -721,15 +854,17 @@ class ProjectTreeGenerator:
 
         node = self.builder.build(valid_roots)
         stats = dict(self.builder.stats)
-        return self.renderer.render(node, stats=stats, roots=valid_roots)
+        return self.renderer.iter_render(node, stats=stats, roots=valid_roots)
 
-    def write_output(self, content: str) -> None:
+    def write_output(self, content: Union[str, Iterable[str]]) -> None:
+        chunks = [content] if isinstance(content, str) else content
         if self.config.output_file:
             out = Path(self.config.output_file)
             out.parent.mkdir(parents=True, exist_ok=True)
-            out.write_text(content, encoding="utf-8")
+            with open(out, "w", encoding="utf-8") as f:
+                f.writelines(chunks)
         else:
-            sys.stdout.write(content)
+            sys.stdout.writelines(chunks)
 
 
 
@@ -849,8 +984,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         gen = ProjectTreeGenerator(config)
         roots = [Path(d) for d in (config.directories or ["."])]
 
-        content = gen.generate(roots)
-        gen.write_output(content)
+        gen.write_output(gen.iter_generate(roots))
         return 0
 
     except KeyboardInterrupt:
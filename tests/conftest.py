@@ -5,23 +5,27 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-@pytest.fixture(autouse=True)
-def cleanup_output_files():
-    """Автоматическая очистка выходных файлов после тестов."""
-    before_test = set()
+def _merged_outputs():
+    """Пути к файлам merged*.txt в рабочей директории (без .git, .venv и кэшей)."""
+    found = set()
     for root, dirs, files in os.walk('.'):
+        # Этот обход выполняется дважды на каждый тест; служебные каталоги не нужны.
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
         for file in files:
             if file.endswith('.txt') and 'merged' in file:
-                before_test.add(os.path.join(root, file))
+                found.add(os.path.join(root, file))
+    return found
+
+
+@pytest.fixture(autouse=True)
+def cleanup_output_files():
+    """Автоматическая очистка выходных файлов после тестов."""
+    before_test = _merged_outputs()
 
     yield
 
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.txt') and 'merged' in file:
-                filepath = os.path.join(root, file)
-                if filepath not in before_test:
-                    try:
-                        os.remove(filepath)
-                    except OSError:
-                        pass
+    for filepath in _merged_outputs() - before_test:
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
@@ -87,6 +87,22 @@ def test_string_scanner_ignores_tokens_inside_quotes_and_handles_escapes():
     assert s2[pos2:] == "// real"
 
 
+def test_single_char_finder_matches_regex_finder():
+    pattern = ce._token_pattern(ce._StringScanner.QUOTES, ("#",))
+    lines = [
+        "x = 1  # c",
+        'x = "# no" # yes',
+        r'x = "a \" # still" # real',
+        "x = 'unterminated # here",
+        "s = `#` + '#' # end",
+        "a\\#b # c",
+        "no marker",
+    ]
+    for line in lines:
+        for start in range(len(line) + 1):
+            assert ce._find_char_token("#", line, start) == ce._find_token(pattern, line, start)
+
+
 # =============================================================================
 # CommentScanner (line)
 # =============================================================================
@@ -147,6 +163,18 @@ def test_scanner_should_remove_false_keeps_comment_even_in_remove_mode():
     assert out == ["x = 1  # hi\n"]
 
 
+def test_scanner_extract_only_returns_input_lines():
+    style = ce.CommentStyle(line_markers=("#",), block_markers=())
+    scanner = ce.CommentScanner(style)
+    lines = ["x = 1  # hi\n", "y = 2\n"]
+
+    out, matches, removed = scanner.scan_and_strip(lines, remove=False, should_remove=lambda m: True)
+
+    assert out is lines
+    assert [m.text for m in matches] == ["hi"]
+    assert removed == 0
+
+
 # =============================================================================
 # CommentScanner (block)
 # =============================================================================
@@ -376,6 +404,63 @@ def test_processor_cache_by_mtime(monkeypatch, tmp_path):
     assert r1[1][0].text == "hi"
 
 
+def test_processor_cache_detects_size_change_with_same_mtime(tmp_path):
+    f = tmp_path / "a.py"
+    f.write_text("x = 1  # hi\n", encoding="utf-8")
+    st = f.stat()
+
+    proc = ce.CommentProcessor(make_config(tmp_path, use_cache=True))
+    assert [m.text for m in proc.process_file(f)[1]] == ["hi"]
+
+    f.write_text("x = 1  # hi\ny = 2  # there\n", encoding="utf-8")
+    ce.os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert [m.text for m in proc.process_file(f)[1]] == ["hi", "there"]
+
+
+def test_processor_reuses_scanner_per_style(tmp_path):
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("x = 1  # one\n", encoding="utf-8")
+    b.write_text('"""open\n', encoding="utf-8")
+
+    proc = ce.CommentProcessor(make_config(tmp_path, use_cache=False))
+    _removed, m_b = proc.process_file(b)
+    _removed, m_a = proc.process_file(a)
+
+    assert len(proc._scanners) == 1
+    assert m_b == []
+    assert [m.text for m in m_a] == ["one"]
+
+
+def test_processor_skips_files_without_marker_bytes(monkeypatch, tmp_path):
+    f = tmp_path / "plain.py"
+    f.write_text("x = 1\ny = 2\n", encoding="utf-8")
+
+    class FailingScanner:
+        def __init__(self, *a, **k):
+            raise AssertionError("scanner must not be built for marker-free files")
+
+    monkeypatch.setattr(ce, "CommentScanner", FailingScanner)
+
+    proc = ce.CommentProcessor(make_config(tmp_path))
+    assert proc.process_file(f) == (0, [])
+
+
+def test_processor_memory_maps_large_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "_MMAP_MIN_SIZE", 1)
+    f = tmp_path / "a.js"
+    f.write_text("let x = 1; // héllo\nlet y = 2;\n", encoding="utf-8")
+    plain = tmp_path / "b.js"
+    plain.write_text("let z = 3;\n", encoding="utf-8")
+
+    proc = ce.CommentProcessor(make_config(tmp_path, comment_symbols="//"))
+    _removed, matches = proc.process_file(f)
+
+    assert [m.text for m in matches] == ["héllo"]
+    assert proc.process_file(plain) == (0, [])
+
+
 # =============================================================================
 # Language filter
 # =============================================================================
@@ -403,6 +488,18 @@ def test_language_filter_short_text_does_not_call_detect(monkeypatch, tmp_path):
     assert proc._should_remove_comment("short") is True
 
 
+def test_language_filter_text_without_letters_does_not_call_detect(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "LANGDETECT_AVAILABLE", True)
+
+    def boom(_s):
+        raise AssertionError("detect() must not be called")
+
+    monkeypatch.setattr(ce, "detect", boom)
+
+    proc = ce.CommentProcessor(make_config(tmp_path, language_filter="en", min_langdetect_len=5, remove_comments=True))
+    assert proc._should_remove_comment("1234 5678 ==== 2024_01_01") is True
+
+
 def test_language_filter_exception_defaults_to_remove(monkeypatch, tmp_path):
     monkeypatch.setattr(ce, "LANGDETECT_AVAILABLE", True)
 
@@ -420,6 +517,78 @@ def test_language_filter_exception_defaults_to_remove(monkeypatch, tmp_path):
     assert proc._should_remove_comment("This is a sufficiently long sentence for detection.") is True
 
 
+def test_language_filter_detects_repeated_text_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "LANGDETECT_AVAILABLE", True)
+    calls = []
+
+    def fake_detect(s):
+        calls.append(s)
+        return "en"
+
+    monkeypatch.setattr(ce, "detect", fake_detect)
+
+    proc = ce.CommentProcessor(make_config(tmp_path, language_filter="en", remove_comments=True))
+    for _ in range(3):
+        assert proc._should_remove_comment("Copyright notice repeated in every single file.") is True
+    assert len(calls) == 1
+
+
+def _stub_langdetect(monkeypatch, profiles_dir: Path):
+    """Install a fake langdetect package whose detector reports the last loaded profile."""
+    import sys
+    import types
+
+    class StubFactory:
+        def __init__(self):
+            self.langs = []
+
+        def load_json_profile(self, profiles):
+            self.langs = [json.loads(p)["name"] for p in profiles]
+
+        def create(self):
+            factory = self
+
+            class StubDetector:
+                def append(self, text):
+                    self.text = text
+
+                def detect(self):
+                    return "nl" if "nl" in factory.langs else factory.langs[0]
+
+            return StubDetector()
+
+    detector_factory = types.ModuleType("langdetect.detector_factory")
+    detector_factory.PROFILES_DIRECTORY = str(profiles_dir)
+    detector_factory.DetectorFactory = StubFactory
+    detector_factory._factory = None
+    package = types.ModuleType("langdetect")
+    package.detector_factory = detector_factory
+    monkeypatch.setitem(sys.modules, "langdetect", package)
+    monkeypatch.setitem(sys.modules, "langdetect.detector_factory", detector_factory)
+    return detector_factory
+
+
+def test_language_filter_loads_profile_for_each_new_language(monkeypatch, tmp_path):
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+    for name in ("en", "nl", "sw"):
+        (profiles_dir / name).write_text(json.dumps({"name": name}), encoding="utf-8")
+    detector_factory = _stub_langdetect(monkeypatch, profiles_dir)
+    monkeypatch.setattr(ce, "LANGDETECT_AVAILABLE", True)
+    monkeypatch.setattr(ce, "_langdetect_factory", None)
+
+    text = "Dit is een voldoende lange Nederlandse zin."
+    en_proc = ce.CommentProcessor(make_config(tmp_path, language_filter="en", remove_comments=True))
+    assert en_proc._should_remove_comment(text) is True  # "nl" profile not loaded yet
+
+    nl_proc = ce.CommentProcessor(make_config(tmp_path, language_filter="nl", remove_comments=True))
+    assert nl_proc._should_remove_comment(text) is True
+    assert ce._langdetect_factory[1].langs == ["en", "nl"]  # subset + "nl", not every profile
+    assert en_proc._should_remove_comment(text) is True
+    # langdetect's process-wide factory is left alone
+    assert detector_factory._factory is None
+
+
 def test_normalize_for_langdetect():
     s = ce.CommentProcessor._normalize_for_langdetect("def hello(): return 1 !!!")
     assert "def" not in s.lower()
@@ -449,6 +618,23 @@ def test_process_files_no_files(monkeypatch, tmp_path):
     assert res["total_files"] == 0
 
 
+def test_process_files_shares_repeated_comment_strings(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    files = []
+    for name in ("a.py", "b.py"):
+        f = tmp_path / name
+        f.write_text("x = 1  # Copyright Example\n", encoding="utf-8")
+        files.append(f)
+
+    proc = ce.CommentProcessor(make_config(tmp_path))
+    monkeypatch.setattr(proc, "find_files", lambda: files)
+    first, second = proc.process_files()["comments"]
+
+    assert first["text"] == "Copyright Example"
+    assert first["text"] is second["text"]
+    assert first["raw"] is second["raw"]
+
+
 def test_process_files_export_json_jsonl_txt(monkeypatch, tmp_path):
     monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
     monkeypatch.setattr(ce.FileContentDetector, "detect_file_type", lambda _p: ce.FileType.TEXT)
@@ -479,6 +665,150 @@ def test_process_files_export_json_jsonl_txt(monkeypatch, tmp_path):
     assert "EXTRACTED COMMENTS REPORT" in export_txt.read_text(encoding="utf-8")
 
 
+def test_process_files_in_worker_processes_keeps_order(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 2)
+
+    for i in range(4):
+        (tmp_path / f"f{i}.py").write_text(f"x = {i}  # c{i}\n", encoding="utf-8")
+
+    proc = ce.CommentProcessor(make_config(tmp_path, include_pattern="*.py"))
+    res = proc.process_files()
+
+    assert res["total_files"] == 4
+    assert [c["text"] for c in res["comments"]] == ["c0", "c1", "c2", "c3"]
+
+
+def test_process_files_pool_fills_cache_and_serves_hits_in_process(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 2)
+
+    for i in range(4):
+        (tmp_path / f"f{i}.py").write_text(f"x = {i}  # c{i}\n", encoding="utf-8")
+
+    proc = ce.CommentProcessor(make_config(tmp_path, include_pattern="*.py"))
+    first = proc.process_files()
+    assert len(proc._cache) == 4
+
+    class NoPool:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("cache hits must not start a pool")
+
+    monkeypatch.setattr(ce, "ProcessPoolExecutor", NoPool)
+    assert proc.process_files()["comments"] == first["comments"]
+
+
+def test_process_files_removal_with_colliding_backups_keeps_every_backup(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 4)
+    pools = []
+    real_pool = ce.ProcessPoolExecutor
+
+    def spy_pool(*args, **kwargs):
+        pools.append(args)
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(ce, "ProcessPoolExecutor", spy_pool)
+
+    roots = [tmp_path / "a", tmp_path / "b"]
+    for root in roots:
+        root.mkdir()
+        for i in range(6):
+            (root / f"f{i}.py").write_text(f"x = {i}  # {root.name}{i}\n", encoding="utf-8")
+
+    backup_dir = tmp_path / "backups"
+    cfg = make_config(
+        tmp_path,
+        directories=[str(r) for r in roots],
+        include_pattern="*.py",
+        remove_comments=True,
+        backup_dir=backup_dir,
+    )
+    res = ce.CommentProcessor(cfg).process_files()
+
+    # Backup names are picked by exists()-then-copy, so removal never runs in workers.
+    assert pools == []
+    assert res["removed_comments"] == 12
+    # Files of the second root map onto the same backup names as the first root's.
+    backups = sorted(p.read_text(encoding="utf-8") for p in backup_dir.iterdir())
+    originals = sorted(f"x = {i}  # {r}{i}\n" for r in ("a", "b") for i in range(6))
+    assert backups == originals
+
+
+def test_init_worker_configures_logging_when_unconfigured(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    monkeypatch.setattr(ce.logging, "basicConfig", lambda **kw: calls.append(kw))
+    monkeypatch.setattr(ce, "_worker_processor", None)
+
+    ce._init_worker(make_config(tmp_path), logging.WARNING)
+
+    assert calls and calls[0]["level"] == logging.WARNING
+    assert ce._worker_processor is not None
+
+
+def test_process_files_single_cpu_stays_in_process(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 1)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a one-CPU run must not start a pool")
+
+    monkeypatch.setattr(ce, "ProcessPoolExecutor", no_pool)
+    for i in range(4):
+        (tmp_path / f"f{i}.py").write_text(f"x = {i}  # c{i}\n", encoding="utf-8")
+
+    res = ce.CommentProcessor(make_config(tmp_path, include_pattern="*.py")).process_files()
+    assert [c["text"] for c in res["comments"]] == ["c0", "c1", "c2", "c3"]
+
+
+def test_process_files_broken_pool_finishes_in_process(monkeypatch, tmp_path):
+    from concurrent.futures.process import BrokenProcessPool
+
+    monkeypatch.setattr(ce, "ProgressReporter", DummyProgress)
+    monkeypatch.setattr(ce, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(ce.os, "cpu_count", lambda: 2)
+
+    class DyingPool:
+        def __init__(self, *args, initializer=None, initargs=(), **kwargs):
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, files, chunksize=1):
+            yield fn(files[0])
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(ce, "ProcessPoolExecutor", DyingPool)
+    for i in range(4):
+        (tmp_path / f"f{i}.py").write_text(f"x = {i}  # c{i}\n", encoding="utf-8")
+
+    res = ce.CommentProcessor(make_config(tmp_path, include_pattern="*.py")).process_files()
+    assert [c["text"] for c in res["comments"]] == ["c0", "c1", "c2", "c3"]
+
+
+def test_export_without_orjson_falls_back_to_json(monkeypatch, tmp_path):
+    monkeypatch.setattr(ce, "ORJSON_AVAILABLE", False)
+    proc = ce.CommentProcessor(make_config(tmp_path))
+    comments = [{"file": "a.py", "relative_path": "a.py", "kind": "line", "text": "привет", "raw": "# привет"}]
+
+    proc._export_comments(comments, tmp_path / "out.jsonl")
+    proc._export_comments(comments, tmp_path / "out.json")
+
+    lines = (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(ln)["text"] for ln in lines] == ["привет"]
+    payload = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+    assert payload["comments"] == comments
+
+
 def test_export_error_is_logged(monkeypatch, tmp_path, caplog):
     proc = ce.CommentProcessor(make_config(tmp_path))
     comments = [{
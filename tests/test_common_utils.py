@@ -217,6 +217,42 @@ class TestGitIgnoreParser:
         important_pyc.touch()
         assert parser.should_ignore(important_pyc) is False
 
+    def test_grouped_patterns_keep_last_match_order(self, tmp_path):
+        """Test merged pattern groups still let the last matching rule win."""
+        parser = GitIgnoreParser(tmp_path)
+        for pattern in ("*.log", "build/", "!keep.log", "!build/", "*.tmp", "keep.log"):
+            parser.add_pattern(pattern)
+
+        build = tmp_path / "build"
+        build.mkdir()
+        keep = tmp_path / "keep.log"
+        keep.touch()
+        other = tmp_path / "other.log"
+        other.touch()
+
+        assert len(parser._groups) == 0  # built lazily
+        assert parser.should_ignore(keep) is True
+        assert parser.should_ignore(other) is True
+        assert parser.should_ignore(build) is False
+        assert len(parser._groups) == 3
+
+    def test_patterns_edited_in_place_are_refinalized(self, tmp_path):
+        """Test same-length edits or reassignment of `patterns` rebuild rules and drop the cache."""
+        parser = GitIgnoreParser(tmp_path)
+        parser.add_pattern("*.log")
+        log_file = tmp_path / "a.log"
+        tmp_file = tmp_path / "a.tmp"
+        log_file.touch()
+        tmp_file.touch()
+        assert parser.should_ignore(tmp_file) is False
+
+        parser.patterns[0] = "*.tmp"
+        assert parser.should_ignore(tmp_file) is True
+        assert parser.should_ignore(log_file) is False
+
+        parser.patterns = ["*.log"]
+        assert parser.should_ignore(log_file) is True
+
     def test_cache_behavior(self, tmp_path):
         """Test caching of ignore decisions."""
         parser = GitIgnoreParser(tmp_path)
@@ -238,6 +274,32 @@ class TestGitIgnoreParser:
 
         assert result1 == result2 is True
 
+    def test_should_ignore_uses_given_is_dir(self, tmp_path, monkeypatch):
+        """Test a caller-supplied is_dir replaces the filesystem check."""
+        parser = GitIgnoreParser(tmp_path)
+        parser.add_pattern("build/")
+        build = tmp_path / "build"
+        build.mkdir()
+
+        def fail_is_dir(self):
+            raise AssertionError("is_dir must not be called")
+
+        monkeypatch.setattr(Path, "is_dir", fail_is_dir)
+        assert parser.should_ignore(build, is_dir=True) is True
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test the verdict cache evicts its oldest entries at the size limit."""
+        monkeypatch.setattr("codingutils.common_utils._GITIGNORE_CACHE_MAX", 2)
+        parser = GitIgnoreParser(tmp_path)
+        parser.add_pattern("*.pyc")
+
+        paths = [tmp_path / f"f{i}.pyc" for i in range(3)]
+        for p in paths:
+            p.touch()
+            assert parser.should_ignore(p) is True
+
+        assert list(parser._cache) == [str(paths[1]), str(paths[2])]
+
     def test_path_not_under_root(self, tmp_path):
         """Test path not under root directory."""
         parser = GitIgnoreParser(tmp_path)
@@ -392,6 +454,27 @@ class TestFileSystemWalker:
 
         assert len(files) == 2
 
+    def test_find_files_wide_level_matches_serial_walk(self, tmp_path, monkeypatch):
+        """Test that levels scanned by the thread pool give the same files and stats."""
+        for i in range(6):
+            sub = tmp_path / f"pkg{i}" / "inner"
+            sub.mkdir(parents=True)
+            (sub.parent / "mod.py").touch()
+            (sub / "deep.py").touch()
+            (sub / "notes.txt").touch()
+
+        config = FilterConfig(include_pattern="*.py", recursive=True, max_depth=2)
+        parallel = FileSystemWalker(config)
+        parallel_files = parallel.find_files([tmp_path])
+
+        monkeypatch.setattr("codingutils.common_utils._WALK_PARALLEL_MIN_DIRS", 10**6)
+        serial = FileSystemWalker(config)
+        serial_files = serial.find_files([tmp_path])
+
+        assert parallel_files == serial_files
+        assert len(parallel_files) == 6
+        assert parallel.stats == serial.stats
+
     def test_find_files_nonexistent_directory(self):
         """Test finding files in non-existent directory."""
         config = FilterConfig(include_pattern="*.py", recursive=True)
@@ -406,11 +489,12 @@ class TestFileSystemWalker:
         config = FilterConfig(include_pattern="*", recursive=True)
         walker = FileSystemWalker(config)
 
-        # Mock iterdir to raise PermissionError
-        def mock_iterdir(self):
+        # Mock scandir to raise PermissionError
+        def mock_scandir(path):
             raise PermissionError("Permission denied")
 
-        monkeypatch.setattr(Path, "iterdir", mock_iterdir)
+        (tmp_path / "visible.txt").touch()
+        monkeypatch.setattr("codingutils.common_utils.os.scandir", mock_scandir)
 
         # Should not crash
         files = walker.find_files([tmp_path])
@@ -515,6 +599,8 @@ class TestUtilityFunctions:
         (1024 * 1024, "1.00 MB"),
         (1024 * 1024 * 1024, "1.00 GB"),
         (1024 * 1024 * 1024 * 1024, "1.00 TB"),
+        (1024 ** 5, "1024.00 TB"),
+        (1536, "1.50 KB"),
     ])
     def test_format_size(self, size_bytes, expected):
         """Test size formatting."""
@@ -595,6 +681,41 @@ class TestSafeFileProcessor:
         assert test_file.read_text() == "Original content"
         assert not backup_file.exists()  # Backup cleaned up
 
+    @pytest.mark.parametrize("fail,keep_backup,expected", [
+        (True, False, "Original content"),
+        (False, True, "Original content"),
+        (False, False, None),
+    ])
+    def test_original_content_after_exit(self, tmp_path, fail, keep_backup, expected):
+        """Test original_content after exit: kept after a restore or a kept backup, else gone."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Original content")
+
+        processor = SafeFileProcessor(test_file, backup=True, keep_backup=keep_backup)
+        try:
+            with processor:
+                test_file.write_text("Modified content")
+                if fail:
+                    raise ValueError("Test error")
+        except ValueError:
+            pass
+
+        assert processor.original_content == expected
+
+    def test_context_manager_error_keeps_requested_backup(self, tmp_path):
+        """Test that restoring on error leaves the backup when keep_backup=True."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Original content")
+
+        with pytest.raises(ValueError):
+            with SafeFileProcessor(test_file, backup=True, keep_backup=True) as processor:
+                test_file.write_text("Modified content")
+                assert processor.original_content == "Original content"
+                raise ValueError("Test error")
+
+        assert test_file.read_text() == "Original content"
+        assert (tmp_path / "test.txt.bak").read_text() == "Original content"
+
     def test_context_manager_no_backup(self, tmp_path):
         """Test file operation without backup."""
         test_file = tmp_path / "test.txt"
@@ -619,6 +740,21 @@ class TestSafeFileProcessor:
         assert test_file.read_text() == "Test content"
         assert not (tmp_path / "test.txt.bak").exists()  # Backup cleaned up
 
+    def test_safe_write_without_backup_skips_original_read(self, tmp_path, monkeypatch):
+        """Test safe_write without backup does not read the file it replaces."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Original content")
+
+        def fail_read_text(self, *args, **kwargs):
+            raise AssertionError("original content must not be read")
+
+        monkeypatch.setattr(Path, "read_text", fail_read_text)
+
+        assert safe_write(test_file, "New content", backup=False) is True
+        monkeypatch.undo()
+        assert test_file.read_text() == "New content"
+        assert not (tmp_path / "test.txt.bak").exists()
+
     def test_safe_write_error(self, tmp_path, monkeypatch):
         """Test safe_write function with error."""
         test_file = tmp_path / "test.txt"
@@ -657,6 +793,30 @@ class TestProgressReporter:
         assert "Processing" in captured.out
         assert "100.0%" in captured.out  # Ищем с точностью до 1 знака
 
+    def test_updates_within_same_step_are_not_written(self, capsys):
+        """Test that updates which do not move the shown 0.1% step print nothing."""
+        with ProgressReporter(total=100000, description="Processing") as progress:
+            for _ in range(100000):
+                progress.update(1)
+
+        lines = capsys.readouterr().out.splitlines()
+        # initial 0.0% line, one per 0.1% step, the final line and the summary
+        assert len(lines) == 1 + 1000 + 1 + 1
+        assert "100.0%" in lines[-2]
+
+    def test_reentered_reporter_prints_early_steps(self, capsys):
+        """Test that a reused reporter starts its step tracking over on __enter__."""
+        progress = ProgressReporter(total=10, description="Processing")
+        with progress:
+            progress.update(1)
+        progress.current = 0
+        capsys.readouterr()
+
+        with progress:
+            progress.update(1)
+
+        assert "10.0% (1/10)" in capsys.readouterr().out
+
     def test_zero_total(self, capsys):
         """Test progress reporter with zero total."""
         with ProgressReporter(total=0, description="Processing") as progress:
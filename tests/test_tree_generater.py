@@ -192,6 +192,35 @@ def test_exclude_pattern_excludes_by_relative_path(tmp_path):
     assert "readme.md" not in out
 
 
+def test_multiple_exclude_names_and_patterns_combined(tmp_path):
+    root = make_sample_tree(tmp_path)
+
+    cfg = make_config(root, exclude_names={"*.log", "*.js"}, exclude_patterns={"docs/*", "build/*"})
+    gen = tg.ProjectTreeGenerator(cfg)
+    out = gen.generate([root])
+
+    assert "app.log" not in out
+    assert "util.js" not in out
+    assert "docs/" not in out
+    assert "build/" not in out
+    assert "main.py" in out
+    assert "ignored.txt" in out
+
+
+def test_node_filter_reuses_parent_directory_verdict(tmp_path):
+    root = make_sample_tree(tmp_path)
+    write(root / "src" / "build" / "nested.txt", "x")
+
+    cfg = make_config(root, exclude_dirs={"build"})
+    nf = tg.NodeFilter(cfg, None, root=root)
+
+    assert nf.should_include(root / "src", is_dir=True)
+    assert nf.should_include(root / "src" / "main.py", is_dir=False)
+    assert not nf.should_include(root / "src" / "build", is_dir=True)
+    # Descendants of an excluded directory are rejected without re-checking
+    assert not nf.should_include(root / "src" / "build" / "nested.txt", is_dir=False)
+
+
 def test_include_pattern_applies_only_to_files(tmp_path):
     root = make_sample_tree(tmp_path)
 
@@ -216,6 +245,23 @@ def test_exclude_empty_dirs_prunes(tmp_path):
     assert "emptydir/" not in out
 
 
+def test_max_depth_limits_deep_tree(tmp_path):
+    root = tmp_path
+    write(root / "a" / "b" / "c" / "deep.txt", "x")
+    write(root / "a" / "top.txt", "x")
+
+    cfg = make_config(root, max_depth=2, exclude_empty_dirs=True, include_statistics=True)
+    gen = tg.ProjectTreeGenerator(cfg)
+    out = gen.generate([root])
+
+    assert "a/" in out
+    assert "top.txt" in out
+    # "b" is listed at depth 2 but not descended, so it is empty and pruned
+    assert "b/" not in out
+    assert "deep.txt" not in out
+    assert "Directories: 2" in out
+
+
 def test_metadata_permissions_mtime_filetype(tmp_path):
     root = tmp_path
     p = write(root / "x.exe", "abc")  # known binary extension shortcut
@@ -356,6 +402,22 @@ def test_write_output_to_file(tmp_path):
     assert "PROJECT TREE:" in out_file.read_text(encoding="utf-8")
 
 
+def test_streamed_output_matches_generate(tmp_path):
+    root = make_sample_tree(tmp_path / "proj")
+
+    out_file = tmp_path / "tree.md"
+    cfg = make_config(root, format="markdown", output_file=out_file)
+    gen = tg.ProjectTreeGenerator(cfg)
+
+    chunks = list(gen.iter_generate([root]))
+    assert len(chunks) > 1
+    gen.write_output(iter(chunks))
+
+    expected = tg.ProjectTreeGenerator(cfg).generate([root])
+    assert out_file.read_text(encoding="utf-8") == expected
+    assert expected.endswith("\n") and not expected.endswith("\n\n")
+
+
 # =============================================================================
 # CLI helpers + main()
 # =============================================================================